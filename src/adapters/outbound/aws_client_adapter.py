@@ -1,5 +1,6 @@
 import asyncio
-from typing import List, Dict, Any
+from collections import OrderedDict
+from typing import List, Dict, Any, Optional, Set, Tuple
 from contextlib import asynccontextmanager
 import logging
 
@@ -10,20 +11,41 @@ try:
 except ImportError:
     aioboto3 = None
 
+from botocore.config import Config
 from botocore.exceptions import NoCredentialsError, ClientError, BotoCoreError
 from core.ports.outbound.aws_client_port import AWSClientPort
 from core.domain.value_objects.aws_credentials import AWSCredentials, AWSAccountInfo
 
 logger = logging.getLogger(__name__)
 
+# Largest page each listing API accepts, so full listings take as few requests as possible
+EC2_MAX_PAGE_SIZE = 1000
+RDS_MAX_PAGE_SIZE = 100
+
+# Concurrent AWS calls, and the HTTP connections each pooled client keeps for them
+MAX_CONCURRENT_CONNECTIONS = 10
+
+# Long-lived clients kept open, least recently used first out
+MAX_CACHED_CLIENTS = 32
+
 
 class AWSClientAdapter(AWSClientPort):
     """AWS client adapter with proper async implementation"""
 
     def __init__(self):
         self._use_aioboto3 = aioboto3 is not None
-        self._session_cache: Dict[str, Any] = {}
-        self._connection_semaphore = asyncio.Semaphore(10)  # Limit concurrent connections
+        self._session_cache: Dict[AWSCredentials, Any] = {}
+        self._connection_semaphore = asyncio.Semaphore(MAX_CONCURRENT_CONNECTIONS)  # Limit concurrent connections
+        
+        # Clients stay open between calls so their connection pools are reused;
+        # keyed by (credentials, service, region) since credentials are immutable
+        self._client_cache: OrderedDict[Tuple[AWSCredentials, str, Optional[str]], Any] = OrderedDict()
+        self._client_lock = asyncio.Lock()
+        # Calls currently using each client; an evicted client that is still
+        # in use is retired and closed when its last call finishes
+        self._client_users: Dict[Any, int] = {}
+        self._retired_clients: Set[Any] = set()
+        self._client_config = Config(max_pool_connections=MAX_CONCURRENT_CONNECTIONS)
         
         if not self._use_aioboto3:
             logger.warning(
@@ -35,23 +57,68 @@ class AWSClientAdapter(AWSClientPort):
     async def _get_client(self, service: str, credentials: AWSCredentials, region: str = None):
         """Get an AWS client with proper async context management"""
         async with self._connection_semaphore:
+            client = await self._get_cached_client(service, credentials, region or credentials.region)
+            self._client_users[client] = self._client_users.get(client, 0) + 1
+            try:
+                yield client
+            finally:
+                users = self._client_users.pop(client) - 1
+                if users:
+                    self._client_users[client] = users
+                elif client in self._retired_clients:
+                    self._retired_clients.discard(client)
+                    await self._close_client(client)
+
+    async def _get_cached_client(self, service: str, credentials: AWSCredentials, region: str):
+        """Return the open client for these credentials, creating it on first use"""
+        key = (credentials, service, region)
+        client = self._client_cache.get(key)
+        if client is not None:
+            self._client_cache.move_to_end(key)
+            return client
+        
+        async with self._client_lock:
+            client = self._client_cache.get(key)
+            if client is not None:
+                return client
+            
+            session = self._session_cache.get(credentials)
+            if session is None:
+                if self._use_aioboto3:
+                    session = self._create_aioboto3_session(credentials)
+                else:
+                    # Fallback to boto3 with thread pool (but improved)
+                    session = self._create_boto3_session(credentials)
+                self._session_cache[credentials] = session
+            
             if self._use_aioboto3:
-                session = self._create_aioboto3_session(credentials)
-                async with session.client(
-                    service, 
-                    region_name=region or credentials.region
-                ) as client:
-                    yield client
+                # Entered once and closed on eviction or cleanup, not per call
+                client = await session.client(
+                    service, region_name=region, config=self._client_config
+                ).__aenter__()
             else:
-                # Fallback to boto3 with thread pool (but improved)
-                session = self._create_boto3_session(credentials)
-                client = session.client(service, region_name=region or credentials.region)
-                try:
-                    yield client
-                finally:
-                    # Close client if it has a close method
-                    if hasattr(client, 'close'):
-                        client.close()
+                client = session.client(service, region_name=region, config=self._client_config)
+            self._client_cache[key] = client
+            
+            while len(self._client_cache) > MAX_CACHED_CLIENTS:
+                (evicted_credentials, _, _), evicted = self._client_cache.popitem(last=False)
+                if evicted in self._client_users:
+                    self._retired_clients.add(evicted)
+                else:
+                    await self._close_client(evicted)
+                if not any(cached[0] == evicted_credentials for cached in self._client_cache):
+                    self._session_cache.pop(evicted_credentials, None)
+            return client
+
+    async def _close_client(self, client) -> None:
+        """Close a cached client and its connection pool"""
+        try:
+            if self._use_aioboto3:
+                await client.close()
+            elif hasattr(client, 'close'):
+                client.close()
+        except Exception as e:
+            logger.warning(f"Error closing AWS client: {e}")
 
     async def _execute_aws_operation(self, operation_func, *args, **kwargs):
         """Execute AWS operation with proper error handling and retries"""
@@ -97,21 +164,31 @@ class AWSClientAdapter(AWSClientPort):
                 logger.error(f"Unexpected error in AWS operation: {e}")
                 raise
 
+    async def _paginate(self, client, operation: str, result_key: str, page_size: int) -> List[Dict[str, Any]]:
+        """Collect every item of a paginated operation, requesting the largest pages allowed"""
+        pages = client.get_paginator(operation).paginate(PaginationConfig={'PageSize': page_size})
+        if self._use_aioboto3:
+            return [item async for page in pages for item in page.get(result_key, [])]
+        # boto3 paginators issue blocking requests while iterating
+        return await self._execute_aws_operation(
+            lambda: [item for page in pages for item in page.get(result_key, [])]
+        )
+
     async def validate_credentials(self, credentials: AWSCredentials) -> bool:
         """Validate AWS credentials"""
         try:
-            async with self._get_client('sts', credentials) as sts:
-                if self._use_aioboto3:
-                    await sts.get_caller_identity()
-                else:
-                    await self._execute_aws_operation(sts.get_caller_identity)
-            return True
-        except (NoCredentialsError, ClientError):
-            return False
+            return await self.validate_and_describe(credentials) is not None
         except Exception as e:
             logger.error(f"Error validating credentials: {e}")
             return False
 
+    async def validate_and_describe(self, credentials: AWSCredentials) -> Optional[AWSAccountInfo]:
+        """Validate credentials and return their caller identity with a single STS call"""
+        try:
+            return await self.get_caller_identity(credentials)
+        except (NoCredentialsError, ClientError):
+            return None
+
     async def get_caller_identity(self, credentials: AWSCredentials) -> AWSAccountInfo:
         """Get AWS caller identity information"""
         async with self._get_client('sts', credentials) as sts:
@@ -129,13 +206,10 @@ class AWSClientAdapter(AWSClientPort):
     async def list_ec2_instances(self, credentials: AWSCredentials, region: str = None) -> List[Dict[str, Any]]:
         """List EC2 instances"""
         async with self._get_client('ec2', credentials, region) as ec2:
-            if self._use_aioboto3:
-                response = await ec2.describe_instances()
-            else:
-                response = await self._execute_aws_operation(ec2.describe_instances)
+            reservations = await self._paginate(ec2, 'describe_instances', 'Reservations', EC2_MAX_PAGE_SIZE)
             
             instances = []
-            for reservation in response.get('Reservations', []):
+            for reservation in reservations:
                 for instance in reservation.get('Instances', []):
                     instances.append({
                         'InstanceId': instance['InstanceId'],
@@ -152,13 +226,10 @@ class AWSClientAdapter(AWSClientPort):
     async def list_rds_instances(self, credentials: AWSCredentials, region: str = None) -> List[Dict[str, Any]]:
         """List RDS instances"""
         async with self._get_client('rds', credentials, region) as rds:
-            if self._use_aioboto3:
-                response = await rds.describe_db_instances()
-            else:
-                response = await self._execute_aws_operation(rds.describe_db_instances)
+            db_instances = await self._paginate(rds, 'describe_db_instances', 'DBInstances', RDS_MAX_PAGE_SIZE)
             
             instances = []
-            for instance in response.get('DBInstances', []):
+            for instance in db_instances:
                 instances.append({
                     'DBInstanceIdentifier': instance['DBInstanceIdentifier'],
                     'DBInstanceClass': instance['DBInstanceClass'],
@@ -234,13 +305,10 @@ class AWSClientAdapter(AWSClientPort):
     async def describe_security_groups(self, credentials: AWSCredentials, region: str = None) -> List[Dict[str, Any]]:
         """Describe security groups"""
         async with self._get_client('ec2', credentials, region) as ec2:
-            if self._use_aioboto3:
-                response = await ec2.describe_security_groups()
-            else:
-                response = await self._execute_aws_operation(ec2.describe_security_groups)
+            groups = await self._paginate(ec2, 'describe_security_groups', 'SecurityGroups', EC2_MAX_PAGE_SIZE)
             
             security_groups = []
-            for sg in response.get('SecurityGroups', []):
+            for sg in groups:
                 security_groups.append({
                     'GroupId': sg['GroupId'],
                     'GroupName': sg['GroupName'],
@@ -285,5 +353,10 @@ class AWSClientAdapter(AWSClientPort):
 
     async def cleanup(self):
         """Cleanup resources"""
+        clients = [*self._client_cache.values(), *self._retired_clients]
+        self._client_cache.clear()
+        self._retired_clients.clear()
+        for client in clients:
+            await self._close_client(client)
         self._session_cache.clear()
         # Additional cleanup can be added here if needed 
\ No newline at end of file
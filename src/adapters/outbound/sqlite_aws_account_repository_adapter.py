@@ -116,9 +116,12 @@ class SQLiteAWSAccountRepositoryAdapter(AWSAccountRepositoryPort):
             self.logger.warning(f"No credentials found in memory for account '{metadata.alias}' - user will need to re-enter them")
         return account
 
-    async def save_account(self, account: AWSAccount) -> AWSAccount:
+    async def save_account(self, account: AWSAccount, make_default: bool = False) -> AWSAccount:
         """
         Save an AWS account (metadata only - credentials stored separately in memory)
+
+        With make_default, other accounts lose their default flag in the same
+        transaction as the save.
         """
         try:
             await self._ensure_initialized()
@@ -126,11 +129,18 @@ class SQLiteAWSAccountRepositoryAdapter(AWSAccountRepositoryPort):
             # Store credentials in memory (never in database)
             await account.store_credentials()
             
+            if make_default:
+                account.mark_as_default()
+            
             # Store only metadata in database
             metadata_dict = self._metadata_to_dict(account.metadata)
             
             async with self._lock:
                 async with aiosqlite.connect(self.db_path) as db:
+                    if make_default:
+                        await db.execute(
+                            "UPDATE aws_account_metadata SET is_default = 0 WHERE alias != ?", (account.alias,)
+                        )
                     await db.execute("""
                         INSERT OR REPLACE INTO aws_account_metadata 
                         (alias, account_id, description, region, uses_profile, is_default, created_at, updated_at)
@@ -208,24 +218,36 @@ class SQLiteAWSAccountRepositoryAdapter(AWSAccountRepositoryPort):
             self.logger.error(f"Error in list_accounts: {e}")
             return []
 
-    async def delete_account(self, alias: str) -> bool:
-        """Delete an AWS account by alias (removes both metadata and credentials)"""
+    async def delete_account(self, alias: str, new_default_alias: Optional[str] = None) -> bool:
+        """
+        Delete an AWS account by alias (removes both metadata and credentials).
+
+        If new_default_alias is given, that account becomes the default in the
+        same transaction, so there is never a window with the deleted account
+        still default or no default at all.
+        """
         try:
             await self._ensure_initialized()
             
-            # Remove credentials from memory
-            from infrastructure.credential_manager import get_credential_manager
-            credential_manager = get_credential_manager()
-            await credential_manager.remove_credentials(alias)
-            
-            # Remove metadata from database
             async with self._lock:
                 async with aiosqlite.connect(self.db_path) as db:
+                    await db.execute("BEGIN")
+                    if new_default_alias:
+                        await db.execute(
+                            "UPDATE aws_account_metadata SET is_default = (alias = ?)", (new_default_alias,)
+                        )
                     cursor = await db.execute("DELETE FROM aws_account_metadata WHERE alias = ?", (alias,))
-                    await db.commit()
                     deleted = cursor.rowcount > 0
+                    if deleted:
+                        await db.commit()
+                    else:
+                        await db.rollback()
                     
             if deleted:
+                # Remove credentials from memory only once the delete is committed
+                from infrastructure.credential_manager import get_credential_manager
+                credential_manager = get_credential_manager()
+                await credential_manager.remove_credentials(alias)
                 self.logger.info(f"Deleted AWS account '{alias}' metadata from database and credentials from memory")
             else:
                 self.logger.debug(f"AWS account '{alias}' was not found for deletion")
@@ -1,12 +1,51 @@
+import asyncio
+import copy
+import logging
 import aiosqlite
+import sqlite3
+from collections import OrderedDict
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from src.core.ports.outbound.chat_repository_port import ChatRepositoryPort
-from src.core.domain.entities.chat import ChatMessage, Conversation
+from src.core.domain.entities.chat import MESSAGE_ROLES, ChatMessage, Conversation
+from src.core.domain.exceptions import ConversationNotFoundError
 from src.infrastructure.logging import get_logger, log_operation
+from src.infrastructure.sqlite_timestamps import from_epoch_micros, to_epoch_micros
 
 logger = get_logger(__name__)
 
+# Statements are compact single-line constants shared by every call, so the
+# text SQLite parses (and the connection's statement cache keys on) stays small.
+_SQL_INSERT_CONVERSATION = "INSERT INTO conversations (id, title, account_id, created_at, updated_at) VALUES (?, ?, ?, ?, ?)"
+_SQL_SELECT_CONVERSATION = "SELECT id, title, account_id, created_at, updated_at FROM conversations WHERE id = ?"
+_SQL_LIST_CONVERSATIONS = "SELECT id, title, account_id, created_at, updated_at FROM conversations ORDER BY updated_at DESC, id DESC LIMIT ? OFFSET ?"
+_SQL_LIST_CONVERSATIONS_AFTER = "SELECT id, title, account_id, created_at, updated_at FROM conversations WHERE (updated_at, id) < (?, ?) ORDER BY updated_at DESC, id DESC LIMIT ?"
+_SQL_MOST_RECENT_CONVERSATION = "SELECT id, title, account_id, created_at, updated_at FROM conversations ORDER BY updated_at DESC, id DESC LIMIT 1"
+_SQL_UPDATE_CONVERSATION = "UPDATE conversations SET title = ?, account_id = ?, updated_at = ? WHERE id = ?"
+_SQL_UPDATE_CONVERSATION_TITLE = "UPDATE conversations SET title = ?, updated_at = ? WHERE id = ? RETURNING id, title, account_id, created_at, updated_at"
+_SQL_DELETE_CONVERSATION = "DELETE FROM conversations WHERE id = ?"
+_SQL_INSERT_MESSAGE = "INSERT INTO chat_messages (id, conversation_id, role, content, timestamp) VALUES (?, ?, ?, ?, ?)"
+_SQL_SELECT_MESSAGE = "SELECT id, conversation_id, role, content, timestamp FROM chat_messages WHERE id = ?"
+_SQL_LIST_MESSAGES = "SELECT id, conversation_id, role, content, timestamp FROM chat_messages WHERE conversation_id = ? ORDER BY timestamp ASC, id ASC LIMIT ? OFFSET ?"
+_SQL_LIST_MESSAGES_AFTER = "SELECT id, conversation_id, role, content, timestamp FROM chat_messages WHERE conversation_id = ? AND (timestamp, id) > (?, ?) ORDER BY timestamp ASC, id ASC LIMIT ?"
+_SQL_DELETE_MESSAGE = "DELETE FROM chat_messages WHERE id = ?"
+
+# Planner statistics are refreshed after this many writes; analysis_limit
+# bounds each ANALYZE to a sample of rows per index
+_ANALYZE_EVERY_WRITES = 1000
+_ANALYSIS_LIMIT = 400
+
+
+def _row_to_conversation(row) -> Conversation:
+    """Decode a (id, title, account_id, created_at, updated_at) row."""
+    return Conversation(row[0], row[1], row[2], from_epoch_micros(row[3]), from_epoch_micros(row[4]))
+
+
+def _row_to_message(row) -> ChatMessage:
+    """Decode a (id, conversation_id, role, content, timestamp) row."""
+    return ChatMessage(row[0], row[1], MESSAGE_ROLES.get(row[2], row[2]), row[3], from_epoch_micros(row[4]))
+
+
 class DatabaseConnection:
     """Async context manager for database connections with foreign keys enabled."""
     
@@ -65,10 +104,47 @@ class DatabaseConnection:
 
 
 class SQLiteChatRepositoryAdapter(ChatRepositoryPort):
-    """SQLite implementation of chat repository."""
+    """SQLite implementation of chat repository.
+    
+    Point lookups are served from small in-process LRU caches that are
+    invalidated by this adapter's own writes. Pass cache_size=0 when other
+    processes write to the same database file.
+    """
     
-    def __init__(self, db_path: str = "data/chats.db"):
+    def __init__(self, db_path: str = "data/chats.db", cache_size: int = 256):
         self.db_path = db_path
+        self._init_lock = asyncio.Lock()
+        
+        # Initialize the database on first use
+        self._initialized = False
+        
+        # Read caches for get_conversation / get_message
+        self._cache_size = cache_size
+        self._conversation_cache: OrderedDict[str, Conversation] = OrderedDict()
+        self._message_cache: OrderedDict[str, ChatMessage] = OrderedDict()
+        
+        self._writes_since_analyze = 0
+    
+    def _cache_get(self, cache: OrderedDict, key: str):
+        """Return a copy of a cached entity, or None on a miss."""
+        entity = cache.get(key)
+        if entity is None:
+            return None
+        cache.move_to_end(key)
+        return copy.copy(entity)
+    
+    def _cache_put(self, cache: OrderedDict, key: str, entity) -> None:
+        """Cache a copy of an entity, evicting the least recently used entry."""
+        if self._cache_size <= 0:
+            return
+        cache[key] = copy.copy(entity)
+        cache.move_to_end(key)
+        if len(cache) > self._cache_size:
+            cache.popitem(last=False)
+    
+    def _invalidate_conversation(self, conversation_id: str) -> None:
+        """Drop a conversation from the read cache."""
+        self._conversation_cache.pop(conversation_id, None)
     
     def _get_db_connection(self, auto_commit: bool = True):
         """Get database connection context manager with foreign keys enabled."""
@@ -78,128 +154,204 @@ class SQLiteChatRepositoryAdapter(ChatRepositoryPort):
         """Get a database connection with explicit transaction control."""
         return DatabaseConnection(self.db_path, auto_commit=False)
     
-    async def _init_db(self):
-        """Initialize database tables."""
-        async with self._get_db_connection() as db:
-            await db.execute("""
-                CREATE TABLE IF NOT EXISTS conversations (
-                    id TEXT PRIMARY KEY,
-                    title TEXT NOT NULL,
-                    account_id TEXT NOT NULL,
-                    created_at TIMESTAMP NOT NULL,
-                    updated_at TIMESTAMP NOT NULL
-                )
-            """)
+    async def _ensure_initialized(self):
+        """Ensure database is initialized with proper schema"""
+        if self._initialized:
+            return
+        
+        async with self._init_lock:
+            # Another coroutine may have finished initialization while we waited
+            if self._initialized:
+                return
             
-            await db.execute("""
-                CREATE TABLE IF NOT EXISTS chat_messages (
-                    id TEXT PRIMARY KEY,
-                    conversation_id TEXT NOT NULL,
-                    role TEXT NOT NULL CHECK (role IN ('user', 'assistant')),
-                    content TEXT NOT NULL,
-                    timestamp TIMESTAMP NOT NULL,
-                    FOREIGN KEY (conversation_id) REFERENCES conversations (id) ON DELETE CASCADE
-                )
-            """)
+            async with self._get_db_connection() as db:
+                await db.execute("""
+                    CREATE TABLE IF NOT EXISTS conversations (
+                        id TEXT PRIMARY KEY,
+                        title TEXT NOT NULL,
+                        account_id TEXT NOT NULL,
+                        created_at INTEGER NOT NULL,
+                        updated_at INTEGER NOT NULL
+                    )
+                """)
             
-            await db.execute("""
-                CREATE INDEX IF NOT EXISTS idx_messages_conversation_timestamp 
-                ON chat_messages (conversation_id, timestamp DESC)
-            """)
+                await db.execute("""
+                    CREATE TABLE IF NOT EXISTS chat_messages (
+                        id TEXT PRIMARY KEY,
+                        conversation_id TEXT NOT NULL,
+                        role TEXT NOT NULL CHECK (role IN ('user', 'assistant')),
+                        content TEXT NOT NULL,
+                        timestamp INTEGER NOT NULL,
+                        FOREIGN KEY (conversation_id) REFERENCES conversations (id) ON DELETE CASCADE
+                    )
+                """)
             
-            await db.execute("""
-                CREATE INDEX IF NOT EXISTS idx_conversations_updated 
-                ON conversations (updated_at DESC)
-            """)
+                # Indexes include id so keyset pagination on (timestamp, id) can walk them
+                await db.execute("DROP INDEX IF EXISTS idx_messages_conversation_timestamp")
+                await db.execute("DROP INDEX IF EXISTS idx_conversations_updated")
             
-            await db.commit()
+                await db.execute("""
+                    CREATE INDEX IF NOT EXISTS idx_messages_conversation_timestamp_id 
+                    ON chat_messages (conversation_id, timestamp, id)
+                """)
+            
+                await db.execute("""
+                    CREATE INDEX IF NOT EXISTS idx_conversations_updated_id 
+                    ON conversations (updated_at DESC, id DESC)
+                """)
+            
+                # Bump the conversation's updated_at as part of each message INSERT,
+                # so adding messages needs no separate UPDATE round-trip. Rows that
+                # are already current are filtered out, so a batch of messages
+                # sharing a timestamp rewrites each conversation row only once.
+                # Recreated on every start so existing databases pick up changes.
+                await db.execute("DROP TRIGGER IF EXISTS trg_chat_messages_touch_conversation")
+                await db.execute("""
+                    CREATE TRIGGER trg_chat_messages_touch_conversation
+                    AFTER INSERT ON chat_messages
+                    BEGIN
+                        UPDATE conversations
+                        SET updated_at = NEW.timestamp
+                        WHERE id = NEW.conversation_id AND updated_at < NEW.timestamp;
+                    END
+                """)
+            
+                await self._analyze(db)
+                await db.commit()
+            
+            self._initialized = True
+    
+    async def _analyze(self, db) -> None:
+        """Refresh sqlite_stat1 so the planner keeps choosing the pagination indexes."""
+        await db.execute(f"PRAGMA analysis_limit = {_ANALYSIS_LIMIT}")
+        await db.execute("ANALYZE")
+    
+    async def _record_writes(self, count: int = 1) -> None:
+        """Count writes and periodically refresh planner statistics."""
+        self._writes_since_analyze += count
+        if self._writes_since_analyze < _ANALYZE_EVERY_WRITES:
+            return
+        
+        self._writes_since_analyze = 0
+        try:
+            async with aiosqlite.connect(self.db_path) as db:
+                await self._analyze(db)
+                await db.commit()
+        except Exception as e:
+            logger.warning("Failed to refresh chat database statistics: %s", e)
     
     async def create_conversation(self, conversation: Conversation) -> Conversation:
         """Create a new conversation."""
-        await self._init_db()
+        await self._ensure_initialized()
         
         async with self._get_db_connection() as db:
-            await db.execute("""
-                INSERT INTO conversations (id, title, account_id, created_at, updated_at)
-                VALUES (?, ?, ?, ?, ?)
-            """, (conversation.id, conversation.title, conversation.account_id, conversation.created_at, conversation.updated_at))
+            await db.execute(_SQL_INSERT_CONVERSATION, (conversation.id, conversation.title, conversation.account_id, to_epoch_micros(conversation.created_at), to_epoch_micros(conversation.updated_at)))
             await db.commit()
         
-        log_operation(
-            logger=logger,
-            operation_type="create_conversation",
-            entity_id=conversation.id,
-            success=True,
-            details={"title": conversation.title}
-        )
+        await self._record_writes()
+        
+        if logger.isEnabledFor(logging.INFO):
+            log_operation(
+                logger=logger,
+                operation_type="create_conversation",
+                entity_id=conversation.id,
+                success=True,
+                details={"title": conversation.title}
+            )
         
         return conversation
     
     async def get_conversation(self, conversation_id: str) -> Optional[Conversation]:
         """Get conversation by ID."""
-        await self._init_db()
+        cached = self._cache_get(self._conversation_cache, conversation_id)
+        if cached:
+            return cached
+        
+        await self._ensure_initialized()
         
         async with aiosqlite.connect(self.db_path) as db:
-            async with db.execute("""
-                SELECT id, title, account_id, created_at, updated_at
-                FROM conversations 
-                WHERE id = ?
-            """, (conversation_id,)) as cursor:
+            async with db.execute(_SQL_SELECT_CONVERSATION, (conversation_id,)) as cursor:
                 row = await cursor.fetchone()
                 
                 if row:
-                    return Conversation(
-                        id=row[0],
-                        title=row[1],
-                        account_id=row[2],
-                        created_at=datetime.fromisoformat(row[3]),
-                        updated_at=datetime.fromisoformat(row[4])
-                    )
+                    conversation = _row_to_conversation(row)
+                    self._cache_put(self._conversation_cache, conversation_id, conversation)
+                    return conversation
                 return None
     
-    async def list_conversations(self, limit: int = 50, offset: int = 0) -> List[Conversation]:
+    async def list_conversations(self, limit: int = 50, offset: int = 0,
+                                 cursor: Optional[Tuple[datetime, str]] = None) -> List[Conversation]:
         """List conversations with pagination."""
-        await self._init_db()
+        await self._ensure_initialized()
+        
+        if cursor is not None:
+            query = _SQL_LIST_CONVERSATIONS_AFTER
+            params = (to_epoch_micros(cursor[0]), cursor[1], limit)
+        else:
+            query = _SQL_LIST_CONVERSATIONS
+            params = (limit, offset)
         
         async with aiosqlite.connect(self.db_path) as db:
-            async with db.execute("""
-                SELECT id, title, account_id, created_at, updated_at
-                FROM conversations 
-                ORDER BY updated_at DESC
-                LIMIT ? OFFSET ?
-            """, (limit, offset)) as cursor:
-                rows = await cursor.fetchall()
-                
-                return [
-                    Conversation(
-                        id=row[0],
-                        title=row[1],
-                        account_id=row[2],
-                        created_at=datetime.fromisoformat(row[3]),
-                        updated_at=datetime.fromisoformat(row[4])
-                    )
-                    for row in rows
-                ]
+            async with db.execute(query, params) as db_cursor:
+                # Decode each chunk as it arrives instead of materializing the page first
+                return [_row_to_conversation(row) async for row in db_cursor]
+    
+    async def get_most_recent_conversation(self) -> Optional[Conversation]:
+        """Get the most recently updated conversation with a single-row index read."""
+        await self._ensure_initialized()
+        
+        async with aiosqlite.connect(self.db_path) as db:
+            async with db.execute(_SQL_MOST_RECENT_CONVERSATION) as cursor:
+                row = await cursor.fetchone()
+        
+        return _row_to_conversation(row) if row else None
     
     async def update_conversation(self, conversation: Conversation) -> Conversation:
         """Update conversation."""
-        await self._init_db()
+        await self._ensure_initialized()
         
         async with aiosqlite.connect(self.db_path) as db:
-            await db.execute("""
-                UPDATE conversations 
-                SET title = ?, account_id = ?, updated_at = ?
-                WHERE id = ?
-            """, (conversation.title, conversation.account_id, conversation.updated_at, conversation.id))
+            await db.execute(_SQL_UPDATE_CONVERSATION, (conversation.title, conversation.account_id, to_epoch_micros(conversation.updated_at), conversation.id))
             await db.commit()
         
-        log_operation(
-            logger=logger,
-            operation_type="update_conversation",
-            entity_id=conversation.id,
-            success=True,
-            details={"title": conversation.title}
-        )
+        self._invalidate_conversation(conversation.id)
+        await self._record_writes()
+        
+        if logger.isEnabledFor(logging.INFO):
+            log_operation(
+                logger=logger,
+                operation_type="update_conversation",
+                entity_id=conversation.id,
+                success=True,
+                details={"title": conversation.title}
+            )
+        
+        return conversation
+    
+    async def update_conversation_title(self, conversation_id: str, title: str, updated_at: datetime) -> Optional[Conversation]:
+        """Set a conversation's title with a single UPDATE ... RETURNING."""
+        await self._ensure_initialized()
+        
+        async with aiosqlite.connect(self.db_path) as db:
+            async with db.execute(_SQL_UPDATE_CONVERSATION_TITLE, (title, to_epoch_micros(updated_at), conversation_id)) as cursor:
+                row = await cursor.fetchone()
+            await db.commit()
+        
+        if not row:
+            return None
+        
+        conversation = _row_to_conversation(row)
+        self._cache_put(self._conversation_cache, conversation_id, conversation)
+        await self._record_writes()
+        
+        if logger.isEnabledFor(logging.INFO):
+            log_operation(
+                logger=logger,
+                operation_type="update_conversation",
+                entity_id=conversation_id,
+                success=True,
+                details={"title": title}
+            )
         
         return conversation
     
@@ -209,64 +361,65 @@ class SQLiteChatRepositoryAdapter(ChatRepositoryPort):
         Thanks to foreign key constraints with ON DELETE CASCADE,
         deleting the conversation will automatically delete all associated messages.
         """
-        await self._init_db()
+        await self._ensure_initialized()
         
         async with self._get_db_connection() as db:
-            cursor = await db.execute("""
-                DELETE FROM conversations WHERE id = ?
-            """, (conversation_id,))
+            cursor = await db.execute(_SQL_DELETE_CONVERSATION, (conversation_id,))
             await db.commit()
             
             success = cursor.rowcount > 0
         
-        log_operation(
-            logger=logger,
-            operation_type="delete_conversation",
-            entity_id=conversation_id,
-            success=success
-        )
+        await self._record_writes()
+        
+        # Messages are removed by ON DELETE CASCADE, so drop them from the cache too
+        self._invalidate_conversation(conversation_id)
+        for message_id in [mid for mid, msg in self._message_cache.items() if msg.conversation_id == conversation_id]:
+            del self._message_cache[message_id]
+        
+        if not success or logger.isEnabledFor(logging.INFO):
+            log_operation(
+                logger=logger,
+                operation_type="delete_conversation",
+                entity_id=conversation_id,
+                success=success
+            )
         
         return success
     
     async def create_conversation_with_message(self, conversation: Conversation, first_message: ChatMessage) -> tuple[Conversation, ChatMessage]:
         """Atomically create a conversation and add the first message."""
-        await self._init_db()
+        await self._ensure_initialized()
+        
+        # Write the conversation with its final updated_at up front, so the
+        # insert trigger has nothing to change and the returned entity matches the row
+        conversation.updated_at = first_message.timestamp
         
         async with self._get_transaction() as db:
             await db.begin_transaction()
             
             # Create conversation
-            await db.execute("""
-                INSERT INTO conversations (id, title, account_id, created_at, updated_at)
-                VALUES (?, ?, ?, ?, ?)
-            """, (conversation.id, conversation.title, conversation.account_id, conversation.created_at, conversation.updated_at))
+            await db.execute(_SQL_INSERT_CONVERSATION, (conversation.id, conversation.title, conversation.account_id, to_epoch_micros(conversation.created_at), to_epoch_micros(conversation.updated_at)))
             
             # Add first message
-            await db.execute("""
-                INSERT INTO chat_messages (id, conversation_id, role, content, timestamp)
-                VALUES (?, ?, ?, ?, ?)
-            """, (first_message.id, first_message.conversation_id, first_message.role, first_message.content, first_message.timestamp))
-            
-            # Update conversation timestamp to match first message
-            await db.execute("""
-                UPDATE conversations 
-                SET updated_at = ?
-                WHERE id = ?
-            """, (first_message.timestamp, conversation.id))
+            await db.execute(_SQL_INSERT_MESSAGE, (first_message.id, first_message.conversation_id, first_message.role, first_message.content, to_epoch_micros(first_message.timestamp)))
             
             # Transaction commits automatically on successful exit
         
-        log_operation(
-            logger=logger,
-            operation_type="create_conversation_with_message",
-            entity_id=conversation.id,
-            success=True,
-            details={
-                "title": conversation.title,
-                "first_message_role": first_message.role,
-                "content_length": len(first_message.content)
-            }
-        )
+        self._cache_put(self._conversation_cache, conversation.id, conversation)
+        await self._record_writes(2)
+        
+        if logger.isEnabledFor(logging.INFO):
+            log_operation(
+                logger=logger,
+                operation_type="create_conversation_with_message",
+                entity_id=conversation.id,
+                success=True,
+                details={
+                    "title": conversation.title,
+                    "first_message_role": first_message.role,
+                    "content_length": len(first_message.content)
+                }
+            )
         
         return conversation, first_message
     
@@ -275,146 +428,126 @@ class SQLiteChatRepositoryAdapter(ChatRepositoryPort):
         if not messages:
             return []
         
-        await self._init_db()
+        await self._ensure_initialized()
         
         async with self._get_transaction() as db:
             await db.begin_transaction()
             
-            # Group messages by conversation for efficient updates
-            conversation_updates = {}
-            
-            for message in messages:
-                # Insert message
-                await db.execute("""
-                    INSERT INTO chat_messages (id, conversation_id, role, content, timestamp)
-                    VALUES (?, ?, ?, ?, ?)
-                """, (message.id, message.conversation_id, message.role, message.content, message.timestamp))
-                
-                # Track latest timestamp per conversation
-                if message.conversation_id not in conversation_updates or message.timestamp > conversation_updates[message.conversation_id]:
-                    conversation_updates[message.conversation_id] = message.timestamp
-            
-            # Update conversation timestamps
-            for conversation_id, latest_timestamp in conversation_updates.items():
-                await db.execute("""
-                    UPDATE conversations 
-                    SET updated_at = ?
-                    WHERE id = ?
-                """, (latest_timestamp, conversation_id))
-        
-        log_operation(
-            logger=logger,
-            operation_type="add_messages_batch",
-            entity_id=f"batch-{len(messages)}",
-            success=True,
-            details={
-                "message_count": len(messages),
-                "conversations_updated": len(conversation_updates)
-            }
-        )
+            # Insert all messages in a single batched call; the insert trigger
+            # advances each conversation's updated_at to its latest message
+            await db.executemany(_SQL_INSERT_MESSAGE, [
+                (message.id, message.conversation_id, message.role, message.content, to_epoch_micros(message.timestamp))
+                for message in messages
+            ])
+        
+        conversation_updates = {message.conversation_id for message in messages}
+        for conversation_id in conversation_updates:
+            self._invalidate_conversation(conversation_id)
+        await self._record_writes(len(messages))
+        
+        if logger.isEnabledFor(logging.INFO):
+            log_operation(
+                logger=logger,
+                operation_type="add_messages_batch",
+                entity_id=f"batch-{len(messages)}",
+                success=True,
+                details={
+                    "message_count": len(messages),
+                    "conversations_updated": len(conversation_updates)
+                }
+            )
         
         return messages
     
     async def add_message(self, message: ChatMessage) -> ChatMessage:
-        """Add message to conversation with atomic transaction."""
-        await self._init_db()
+        """Add message to conversation.
         
-        async with self._get_transaction() as db:
-            await db.begin_transaction()
-            
-            # Insert the message
-            await db.execute("""
-                INSERT INTO chat_messages (id, conversation_id, role, content, timestamp)
-                VALUES (?, ?, ?, ?, ?)
-            """, (message.id, message.conversation_id, message.role, message.content, message.timestamp))
-            
-            # Update conversation's updated_at timestamp atomically
-            await db.execute("""
-                UPDATE conversations 
-                SET updated_at = ?
-                WHERE id = ?
-            """, (message.timestamp, message.conversation_id))
-            
-            # Transaction will be committed automatically on successful exit
-        
-        log_operation(
-            logger=logger,
-            operation_type="add_message",
-            entity_id=message.id,
-            success=True,
-            details={
-                "conversation_id": message.conversation_id,
-                "role": message.role,
-                "content_length": len(message.content)
-            }
-        )
+        The conversation's updated_at is bumped by an insert trigger, so the
+        single INSERT is atomic without an explicit transaction. A missing
+        conversation is reported by the foreign key rather than a prior lookup.
+        """
+        await self._ensure_initialized()
+        
+        async with self._get_db_connection() as db:
+            try:
+                await db.execute(_SQL_INSERT_MESSAGE, (message.id, message.conversation_id, message.role, message.content, to_epoch_micros(message.timestamp)))
+            except sqlite3.IntegrityError as e:
+                if "FOREIGN KEY" in str(e):
+                    raise ConversationNotFoundError(f"Conversation {message.conversation_id} not found") from e
+                raise
+            await db.commit()
+        
+        self._invalidate_conversation(message.conversation_id)
+        await self._record_writes()
+        
+        if logger.isEnabledFor(logging.INFO):
+            log_operation(
+                logger=logger,
+                operation_type="add_message",
+                entity_id=message.id,
+                success=True,
+                details={
+                    "conversation_id": message.conversation_id,
+                    "role": message.role,
+                    "content_length": len(message.content)
+                }
+            )
         
         return message
     
-    async def get_messages(self, conversation_id: str, limit: int = 100, offset: int = 0) -> List[ChatMessage]:
+    async def get_messages(self, conversation_id: str, limit: int = 100, offset: int = 0,
+                           cursor: Optional[Tuple[datetime, str]] = None) -> List[ChatMessage]:
         """Get messages for a conversation with pagination."""
-        await self._init_db()
+        await self._ensure_initialized()
+        
+        if cursor is not None:
+            query = _SQL_LIST_MESSAGES_AFTER
+            params = (conversation_id, to_epoch_micros(cursor[0]), cursor[1], limit)
+        else:
+            query = _SQL_LIST_MESSAGES
+            params = (conversation_id, limit, offset)
         
         async with aiosqlite.connect(self.db_path) as db:
-            async with db.execute("""
-                SELECT id, conversation_id, role, content, timestamp
-                FROM chat_messages 
-                WHERE conversation_id = ?
-                ORDER BY timestamp ASC
-                LIMIT ? OFFSET ?
-            """, (conversation_id, limit, offset)) as cursor:
-                rows = await cursor.fetchall()
-                
-                return [
-                    ChatMessage(
-                        id=row[0],
-                        conversation_id=row[1],
-                        role=row[2],
-                        content=row[3],
-                        timestamp=datetime.fromisoformat(row[4])
-                    )
-                    for row in rows
-                ]
+            async with db.execute(query, params) as db_cursor:
+                return [_row_to_message(row) async for row in db_cursor]
     
     async def get_message(self, message_id: str) -> Optional[ChatMessage]:
         """Get specific message by ID."""
-        await self._init_db()
+        cached = self._cache_get(self._message_cache, message_id)
+        if cached:
+            return cached
+        
+        await self._ensure_initialized()
         
         async with aiosqlite.connect(self.db_path) as db:
-            async with db.execute("""
-                SELECT id, conversation_id, role, content, timestamp
-                FROM chat_messages 
-                WHERE id = ?
-            """, (message_id,)) as cursor:
+            async with db.execute(_SQL_SELECT_MESSAGE, (message_id,)) as cursor:
                 row = await cursor.fetchone()
                 
                 if row:
-                    return ChatMessage(
-                        id=row[0],
-                        conversation_id=row[1],
-                        role=row[2],
-                        content=row[3],
-                        timestamp=datetime.fromisoformat(row[4])
-                    )
+                    message = _row_to_message(row)
+                    self._cache_put(self._message_cache, message_id, message)
+                    return message
                 return None
     
     async def delete_message(self, message_id: str) -> bool:
         """Delete specific message."""
-        await self._init_db()
+        await self._ensure_initialized()
         
         async with aiosqlite.connect(self.db_path) as db:
-            cursor = await db.execute("""
-                DELETE FROM chat_messages WHERE id = ?
-            """, (message_id,))
+            cursor = await db.execute(_SQL_DELETE_MESSAGE, (message_id,))
             await db.commit()
             
             success = cursor.rowcount > 0
         
-        log_operation(
-            logger=logger,
-            operation_type="delete_message",
-            entity_id=message_id,
-            success=success
-        )
+        self._message_cache.pop(message_id, None)
+        await self._record_writes()
+        
+        if not success or logger.isEnabledFor(logging.INFO):
+            log_operation(
+                logger=logger,
+                operation_type="delete_message",
+                entity_id=message_id,
+                success=success
+            )
         
         return success 
\ No newline at end of file
@@ -1,18 +1,77 @@
 import asyncio
+import copy
 import json
 import aiosqlite
-from datetime import datetime
+from collections import OrderedDict
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from datetime import datetime
+from typing import List, Optional, Dict, Any, Tuple
 from core.ports.outbound.task_repository_port import TaskRepositoryPort
 from core.domain.entities.task import Task, TaskStatus
 from infrastructure.logging import get_logger
+from infrastructure.sqlite_timestamps import from_epoch_micros, to_epoch_micros
+from infrastructure.task_migration_helper import migrate_task_database_if_needed
+
+_TASK_COLUMNS = "id, description, account_alias, status, created_at, completed_at, result, error_message, metadata"
+
+_SQL_UPSERT_TASK = (
+    f"INSERT INTO tasks ({_TASK_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?) "
+    "ON CONFLICT(id) DO UPDATE SET description = excluded.description, account_alias = excluded.account_alias, "
+    "status = excluded.status, completed_at = excluded.completed_at, result = excluded.result, "
+    "error_message = excluded.error_message, metadata = excluded.metadata"
+)
+_SQL_SELECT_TASK = f"SELECT {_TASK_COLUMNS} FROM tasks WHERE id = ?"
+_SQL_LIST_TASKS = f"SELECT {_TASK_COLUMNS} FROM tasks ORDER BY created_at DESC, id DESC LIMIT ? OFFSET ?"
+_SQL_LIST_TASKS_AFTER = f"SELECT {_TASK_COLUMNS} FROM tasks WHERE (created_at, id) < (?, ?) ORDER BY created_at DESC, id DESC LIMIT ?"
+_SQL_LIST_TASKS_BY_STATUS = f"SELECT {_TASK_COLUMNS} FROM tasks WHERE status = ? ORDER BY created_at DESC, id DESC"
+_SQL_DELETE_TASK = "DELETE FROM tasks WHERE id = ?"
+# Conditional status changes check and write in one statement, so a concurrent
+# transition can't be overwritten between a read and an update
+_SQL_MARK_IN_PROGRESS = (
+    f"UPDATE tasks SET status = '{TaskStatus.IN_PROGRESS.value}' "
+    f"WHERE id = ? AND status = '{TaskStatus.PENDING.value}' RETURNING {_TASK_COLUMNS}"
+)
+_SQL_COMPLETE_IN_PROGRESS = (
+    f"UPDATE tasks SET status = '{TaskStatus.COMPLETED.value}', result = ?, completed_at = ? "
+    f"WHERE id = ? AND status = '{TaskStatus.IN_PROGRESS.value}' RETURNING {_TASK_COLUMNS}"
+)
+_SQL_FAIL_ACTIVE = (
+    f"UPDATE tasks SET status = '{TaskStatus.FAILED.value}', error_message = ?, completed_at = ? "
+    f"WHERE id = ? AND status IN ('{TaskStatus.PENDING.value}', '{TaskStatus.IN_PROGRESS.value}') "
+    f"RETURNING {_TASK_COLUMNS}"
+)
+
+# Dict lookup is an order of magnitude cheaper than calling TaskStatus(value) per row
+_TASK_STATUSES = {status.value: status for status in TaskStatus}
+
+
+def _row_to_task(row) -> Task:
+    """Decode a row selected in _TASK_COLUMNS order, passing fields positionally"""
+    return Task(
+        row[0], row[1], row[2],
+        _TASK_STATUSES[row[3]],
+        from_epoch_micros(row[4]),
+        from_epoch_micros(row[5]) if row[5] is not None else None,
+        row[6], row[7],
+        json.loads(row[8]) if row[8] else {}
+    )
+
+# Planner statistics are refreshed after this many writes; analysis_limit
+# bounds each ANALYZE to a sample of rows per index
+_ANALYZE_EVERY_WRITES = 1000
+_ANALYSIS_LIMIT = 400
 
 
 class SQLiteTaskRepositoryAdapter(TaskRepositoryPort):
-    """SQLite task repository adapter for local persistence"""
+    """
+    SQLite task repository adapter for local persistence.
+    
+    get_task_by_id is served from a small in-process LRU cache that is
+    invalidated by this adapter's own writes. Pass cache_size=0 when other
+    processes write to the same database file.
+    """
 
-    def __init__(self, db_path: str = "data/tasks.db"):
+    def __init__(self, db_path: str = "data/tasks.db", cache_size: int = 256):
         self.db_path = Path(db_path)
         self.logger = get_logger(__name__)
         self._lock = asyncio.Lock()
@@ -22,12 +81,21 @@ class SQLiteTaskRepositoryAdapter(TaskRepositoryPort):
         
         # Initialize the database on first use
         self._initialized = False
+        
+        # Read cache for get_task_by_id
+        self._cache_size = cache_size
+        self._task_cache: OrderedDict[str, Task] = OrderedDict()
+        
+        self._writes_since_analyze = 0
 
     async def _ensure_initialized(self):
         """Ensure database is initialized with proper schema"""
         if self._initialized:
             return
             
+        if not await migrate_task_database_if_needed(self.db_path):
+            self.logger.warning("Task database migration failed, continuing anyway")
+            
         async with aiosqlite.connect(self.db_path) as db:
             await db.execute("""
                 CREATE TABLE IF NOT EXISTS tasks (
@@ -35,21 +103,63 @@ class SQLiteTaskRepositoryAdapter(TaskRepositoryPort):
                     description TEXT NOT NULL,
                     account_alias TEXT NOT NULL,
                     status TEXT NOT NULL,
-                    created_at TEXT NOT NULL,
-                    completed_at TEXT,
+                    created_at INTEGER NOT NULL,
+                    completed_at INTEGER,
                     result TEXT,
                     error_message TEXT,
                     metadata TEXT
                 )
             """)
+            
+            # Create indexes matching the list queries' filter/ORDER BY so they avoid a filesort
+            await db.execute("""
+                CREATE INDEX IF NOT EXISTS idx_tasks_created
+                ON tasks (created_at DESC, id DESC)
+            """)
+            
+            await db.execute("""
+                CREATE INDEX IF NOT EXISTS idx_tasks_status_created
+                ON tasks (status, created_at DESC, id DESC)
+            """)
+            
+            await self._analyze(db)
             await db.commit()
             
         self.logger.info(
             "DATABASE | aws-sidekick.persistence | "
-            f"database_path=<{self.db_path}> | SQLite database initialized"
+            "database_path=<%s> | SQLite database initialized",
+            self.db_path
         )
         self._initialized = True
 
+    async def _analyze(self, db) -> None:
+        """Refresh sqlite_stat1 so the planner keeps choosing the task indexes"""
+        await db.execute(f"PRAGMA analysis_limit = {_ANALYSIS_LIMIT}")
+        await db.execute("ANALYZE")
+
+    async def _record_writes(self, count: int = 1) -> None:
+        """Count writes and periodically refresh planner statistics"""
+        self._writes_since_analyze += count
+        if self._writes_since_analyze < _ANALYZE_EVERY_WRITES:
+            return
+        
+        self._writes_since_analyze = 0
+        try:
+            async with aiosqlite.connect(self.db_path) as db:
+                await self._analyze(db)
+                await db.commit()
+        except Exception as e:
+            self.logger.warning("Failed to refresh task database statistics: %s", e)
+
+    def _cache_task(self, task: Task) -> None:
+        """Cache a copy of a task, evicting the least recently used entry"""
+        if self._cache_size <= 0:
+            return
+        self._task_cache[task.id] = copy.copy(task)
+        self._task_cache.move_to_end(task.id)
+        if len(self._task_cache) > self._cache_size:
+            self._task_cache.popitem(last=False)
+
     def _task_to_dict(self, task: Task) -> Dict[str, Any]:
         """Convert Task entity to dictionary for database storage"""
         return {
@@ -57,27 +167,13 @@ class SQLiteTaskRepositoryAdapter(TaskRepositoryPort):
             'description': task.description,
             'account_alias': task.account_alias,
             'status': task.status.value,
-            'created_at': task.created_at.isoformat(),
-            'completed_at': task.completed_at.isoformat() if task.completed_at else None,
+            'created_at': to_epoch_micros(task.created_at),
+            'completed_at': to_epoch_micros(task.completed_at) if task.completed_at else None,
             'result': task.result,
             'error_message': task.error_message,
             'metadata': json.dumps(task.metadata) if task.metadata else None
         }
 
-    def _dict_to_task(self, row: Dict[str, Any]) -> Task:
-        """Convert database row to Task entity"""
-        return Task(
-            id=row['id'],
-            description=row['description'],
-            account_alias=row['account_alias'],
-            status=TaskStatus(row['status']),
-            created_at=datetime.fromisoformat(row['created_at']),
-            completed_at=datetime.fromisoformat(row['completed_at']) if row['completed_at'] else None,
-            result=row['result'],
-            error_message=row['error_message'],
-            metadata=json.loads(row['metadata']) if row['metadata'] else {}
-        )
-
     async def save_task(self, task: Task) -> Task:
         """Save a task to the database"""
         try:
@@ -87,90 +183,102 @@ class SQLiteTaskRepositoryAdapter(TaskRepositoryPort):
             
             # Simplified without lock for debugging
             async with aiosqlite.connect(self.db_path) as db:
-                await db.execute("""
-                    INSERT OR REPLACE INTO tasks 
-                    (id, description, account_alias, status, created_at, completed_at, result, error_message, metadata)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
+                await db.execute(_SQL_UPSERT_TASK, (
                     task_dict['id'], task_dict['description'], task_dict['account_alias'], task_dict['status'], 
                     task_dict['created_at'], task_dict['completed_at'],
                     task_dict['result'], task_dict['error_message'], task_dict['metadata']
                 ))
                 await db.commit()
                 
+            self._task_cache.pop(task.id, None)
+            await self._record_writes()
             self.logger.info(
                 "DATABASE | aws-sidekick.persistence | "
-                f"task_id=<{task.id}> status=<{task.status.value}> | Task saved to database"
+                "task_id=<%s> status=<%s> | Task saved to database",
+                task.id, task.status.value
             )
             return task
         except Exception as e:
-            self.logger.error(f"Error saving task: {e} | task_id: {task.id}")
+            self.logger.error("Error saving task: %s | task_id: %s", e, task.id)
             raise
 
     async def get_task_by_id(self, task_id: str) -> Optional[Task]:
         """Get a task by ID from the database"""
+        cached = self._task_cache.get(task_id)
+        if cached:
+            self._task_cache.move_to_end(task_id)
+            return copy.copy(cached)
+        
         try:
             await self._ensure_initialized()
             
             # Simplified without lock for debugging
             async with aiosqlite.connect(self.db_path) as db:
-                db.row_factory = aiosqlite.Row
-                cursor = await db.execute("SELECT * FROM tasks WHERE id = ?", (task_id,))
+                cursor = await db.execute(_SQL_SELECT_TASK, (task_id,))
                 row = await cursor.fetchone()
                 await cursor.close()
                     
             if row:
                 try:
-                    task = self._dict_to_task(dict(row))
+                    task = _row_to_task(row)
+                    self._cache_task(task)
                     self.logger.info(
                         "DATABASE | aws-sidekick.persistence | "
-                        f"task_id=<{task_id}> | Task retrieved from database"
+                        "task_id=<%s> | Task retrieved from database",
+                        task_id
                     )
                     return task
                 except Exception as e:
-                    self.logger.error(f"Error converting row to task: {e} | task_id: {task_id}")
+                    self.logger.error("Error converting row to task: %s | task_id: %s", e, task_id)
                     return None
                     
             self.logger.info(
                 "DATABASE | aws-sidekick.persistence | "
-                f"task_id=<{task_id}> | Task not found in database"
+                "task_id=<%s> | Task not found in database",
+                task_id
             )
             return None
         except Exception as e:
-            self.logger.error(f"Error in get_task_by_id: {e} | task_id: {task_id}")
+            self.logger.error("Error in get_task_by_id: %s | task_id: %s", e, task_id)
             return None
 
-    async def get_tasks(self, limit: int = 100, offset: int = 0) -> List[Task]:
+    async def get_tasks(self, limit: int = 100, offset: int = 0,
+                        cursor: Optional[Tuple[datetime, str]] = None) -> List[Task]:
         """Get list of tasks with pagination"""
         try:
             await self._ensure_initialized()
             
+            if cursor is not None:
+                # Keyset pagination walks idx_tasks_created instead of skipping offset rows
+                query = _SQL_LIST_TASKS_AFTER
+                params = (to_epoch_micros(cursor[0]), cursor[1], limit)
+            else:
+                query = _SQL_LIST_TASKS
+                params = (limit, offset)
+            
             # Simplified without lock for debugging
-            async with aiosqlite.connect(self.db_path) as db:
-                db.row_factory = aiosqlite.Row
-                cursor = await db.execute(
-                    "SELECT * FROM tasks ORDER BY created_at DESC LIMIT ? OFFSET ?",
-                    (limit, offset)
-                )
-                rows = await cursor.fetchall()
-                await cursor.close()
-                    
+            row_to_task = _row_to_task
             tasks = []
-            for row in rows:
-                try:
-                    task = self._dict_to_task(dict(row))
-                    tasks.append(task)
-                except Exception as e:
-                    self.logger.error(f"Error converting row to task: {e} | row: {dict(row)}")
-                    continue
+            async with aiosqlite.connect(self.db_path) as db:
+                # Rows are decoded as aiosqlite delivers each chunk rather than
+                # after materializing the whole page with fetchall()
+                async with db.execute(query, params) as db_cursor:
+                    async for row in db_cursor:
+                        try:
+                            task = row_to_task(row)
+                            tasks.append(task)
+                        except Exception as e:
+                            self.logger.error("Error converting row to task: %s | row: %s", e, row)
+                            continue
                     
             self.logger.info(
                 "DATABASE | aws-sidekick.persistence | "
-                f"limit=<{limit}> offset=<{offset}> count=<{len(tasks)}> | Tasks retrieved from database"
+                "limit=<%s> offset=<%s> count=<%s> | Tasks retrieved from database",
+                limit, offset, len(tasks)
             )
             return tasks
         except Exception as e:
-            self.logger.error(f"Error in get_tasks: {e}")
+            self.logger.error("Error in get_tasks: %s", e)
             return []
 
     async def update_task(self, task: Task) -> Task:
@@ -181,27 +289,68 @@ class SQLiteTaskRepositoryAdapter(TaskRepositoryPort):
             # Just save the task directly - no need to check if it exists
             return await self.save_task(task)
         except Exception as e:
-            self.logger.error(f"Error updating task: {e} | task_id: {task.id}")
+            self.logger.error("Error updating task: %s | task_id: %s", e, task.id)
             raise
 
+    async def _update_returning(self, task_id: str, query: str, params: tuple) -> Optional[Task]:
+        """Run a conditional UPDATE ... RETURNING and cache the task it changed"""
+        await self._ensure_initialized()
+        async with aiosqlite.connect(self.db_path) as db:
+            cursor = await db.execute(query, params)
+            row = await cursor.fetchone()
+            await cursor.close()
+            await db.commit()
+        
+        self._task_cache.pop(task_id, None)
+        if row is None:
+            return None
+        
+        task = _row_to_task(row)
+        self._cache_task(task)
+        await self._record_writes()
+        self.logger.info(
+            "DATABASE | aws-sidekick.persistence | "
+            "task_id=<%s> status=<%s> | Task status updated in database",
+            task_id, task.status.value
+        )
+        return task
+
+    async def mark_in_progress_if_pending(self, task_id: str) -> Optional[Task]:
+        """Move a pending task to in progress"""
+        return await self._update_returning(task_id, _SQL_MARK_IN_PROGRESS, (task_id,))
+
+    async def complete_if_in_progress(self, task_id: str, result: str) -> Optional[Task]:
+        """Mark an in-progress task as completed"""
+        completed_at = to_epoch_micros(datetime.utcnow())
+        return await self._update_returning(task_id, _SQL_COMPLETE_IN_PROGRESS, (result, completed_at, task_id))
+
+    async def fail_if_active(self, task_id: str, error_message: str) -> Optional[Task]:
+        """Mark a pending or in-progress task as failed"""
+        completed_at = to_epoch_micros(datetime.utcnow())
+        return await self._update_returning(task_id, _SQL_FAIL_ACTIVE, (error_message, completed_at, task_id))
+
     async def delete_task(self, task_id: str) -> bool:
         """Delete a task from the database"""
         await self._ensure_initialized()
         async with self._lock:
             async with aiosqlite.connect(self.db_path) as db:
-                cursor = await db.execute("DELETE FROM tasks WHERE id = ?", (task_id,))
+                cursor = await db.execute(_SQL_DELETE_TASK, (task_id,))
                 await db.commit()
                 deleted = cursor.rowcount > 0
                 
+            self._task_cache.pop(task_id, None)
+            await self._record_writes()
             if deleted:
                 self.logger.info(
                     "DATABASE | aws-sidekick.persistence | "
-                    f"task_id=<{task_id}> | Task deleted from database"
+                    "task_id=<%s> | Task deleted from database",
+                    task_id
                 )
             else:
                 self.logger.debug(
                     "DATABASE | aws-sidekick.persistence | "
-                    f"task_id=<{task_id}> | Task not found for deletion"
+                    "task_id=<%s> | Task not found for deletion",
+                    task_id
                 )
                 
             return deleted
@@ -214,6 +363,8 @@ class SQLiteTaskRepositoryAdapter(TaskRepositoryPort):
                 await db.execute("DELETE FROM tasks")
                 await db.commit()
                 
+            self._task_cache.clear()
+            await self._record_writes()
             self.logger.info(
                 "DATABASE | aws-sidekick.persistence | "
                 "All tasks cleared from database"
@@ -230,7 +381,8 @@ class SQLiteTaskRepositoryAdapter(TaskRepositoryPort):
                     
             self.logger.debug(
                 "DATABASE | aws-sidekick.persistence | "
-                f"count=<{count}> | Task count retrieved from database"
+                "count=<%s> | Task count retrieved from database",
+                count
             )
             return count
 
@@ -239,17 +391,14 @@ class SQLiteTaskRepositoryAdapter(TaskRepositoryPort):
         await self._ensure_initialized()
         async with self._lock:
             async with aiosqlite.connect(self.db_path) as db:
-                db.row_factory = aiosqlite.Row
-                async with db.execute(
-                    "SELECT * FROM tasks WHERE status = ? ORDER BY created_at DESC",
-                    (status.value,)
-                ) as cursor:
-                    rows = await cursor.fetchall()
+                row_to_task = _row_to_task
+                async with db.execute(_SQL_LIST_TASKS_BY_STATUS, (status.value,)) as cursor:
+                    tasks = [row_to_task(row) async for row in cursor]
                     
-                tasks = [self._dict_to_task(dict(row)) for row in rows]
                 self.logger.debug(
                     "DATABASE | aws-sidekick.persistence | "
-                    f"status=<{status.value}> count=<{len(tasks)}> | Tasks by status retrieved from database"
+                    "status=<%s> count=<%s> | Tasks by status retrieved from database",
+                    status.value, len(tasks)
                 )
                 return tasks
 
@@ -1,57 +1,90 @@
-import asyncio
-from typing import List, Optional, Dict
+import heapq
+from datetime import datetime
+from typing import List, Optional, Dict, Tuple
 from core.ports.outbound.task_repository_port import TaskRepositoryPort
-from core.domain.entities.task import Task
+from core.domain.entities.task import ACTIVE_TASK_STATUSES, Task, TaskStatus
+
+
+def _sort_key(task: Task) -> Tuple[datetime, str]:
+    """Creation order, with the ID breaking ties"""
+    return task.created_at, task.id
 
 
 class InMemoryTaskRepositoryAdapter(TaskRepositoryPort):
-    """In-memory task repository adapter"""
+    """
+    In-memory task repository adapter
+
+    get_tasks returns a page with a bounded heapq selection on
+    (created_at, id) instead of sorting every task.
+
+    No method awaits while touching the dict, so each call runs
+    atomically on the event loop without a lock.
+    """
 
     def __init__(self):
         self._tasks: Dict[str, Task] = {}
-        self._lock = asyncio.Lock()
 
     async def save_task(self, task: Task) -> Task:
         """Save a task"""
-        async with self._lock:
-            self._tasks[task.id] = task
-            return task
+        self._tasks[task.id] = task
+        return task
 
     async def get_task_by_id(self, task_id: str) -> Optional[Task]:
         """Get a task by ID"""
-        async with self._lock:
-            return self._tasks.get(task_id)
+        return self._tasks.get(task_id)
 
-    async def get_tasks(self, limit: int = 100, offset: int = 0) -> List[Task]:
+    async def get_tasks(self, limit: int = 100, offset: int = 0,
+                        cursor: Optional[Tuple[datetime, str]] = None) -> List[Task]:
         """Get list of tasks with pagination"""
-        async with self._lock:
-            all_tasks = list(self._tasks.values())
-            # Sort by creation date (newest first)
-            all_tasks.sort(key=lambda t: t.created_at, reverse=True)
-            return all_tasks[offset:offset + limit]
+        # Newest first
+        tasks = self._tasks.values()
+        if cursor is not None:
+            tasks = [task for task in tasks if (task.created_at, task.id) < cursor]
+            offset = 0
+        return heapq.nlargest(offset + limit, tasks, key=_sort_key)[offset:]
 
     async def update_task(self, task: Task) -> Task:
         """Update an existing task"""
-        async with self._lock:
-            if task.id not in self._tasks:
-                raise ValueError(f"Task with ID {task.id} not found")
-            self._tasks[task.id] = task
-            return task
+        if task.id not in self._tasks:
+            raise ValueError(f"Task with ID {task.id} not found")
+        self._tasks[task.id] = task
+        return task
+
+    async def mark_in_progress_if_pending(self, task_id: str) -> Optional[Task]:
+        """Move a pending task to in progress"""
+        task = self._tasks.get(task_id)
+        if task is None or task.status != TaskStatus.PENDING:
+            return None
+        task.mark_in_progress()
+        return task
+
+    async def complete_if_in_progress(self, task_id: str, result: str) -> Optional[Task]:
+        """Mark an in-progress task as completed"""
+        task = self._tasks.get(task_id)
+        if task is None or task.status != TaskStatus.IN_PROGRESS:
+            return None
+        task.mark_completed(result)
+        return task
+
+    async def fail_if_active(self, task_id: str, error_message: str) -> Optional[Task]:
+        """Mark a pending or in-progress task as failed"""
+        task = self._tasks.get(task_id)
+        if task is None or task.status not in ACTIVE_TASK_STATUSES:
+            return None
+        task.mark_failed(error_message)
+        return task
 
     async def delete_task(self, task_id: str) -> bool:
         """Delete a task"""
-        async with self._lock:
-            if task_id in self._tasks:
-                del self._tasks[task_id]
-                return True
-            return False
+        if task_id in self._tasks:
+            del self._tasks[task_id]
+            return True
+        return False
 
     async def clear_all_tasks(self) -> None:
         """Clear all tasks (useful for testing)"""
-        async with self._lock:
-            self._tasks.clear()
+        self._tasks.clear()
 
     async def get_task_count(self) -> int:
         """Get total task count"""
-        async with self._lock:
-            return len(self._tasks) 
\ No newline at end of file
+        return len(self._tasks)
@@ -1,13 +1,28 @@
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
+import asyncio
+import copy
 import logging
+import time
+from datetime import datetime
 from core.ports.inbound.aws_account_service_port import AWSAccountServicePort
 from core.ports.outbound.aws_account_repository_port import AWSAccountRepositoryPort
 from core.ports.outbound.aws_client_port import AWSClientPort
 from core.domain.entities.aws_account import AWSAccount
-from core.domain.value_objects.aws_credentials import AWSCredentials
+from core.domain.value_objects.aws_credentials import AWSCredentials, AWSAccountInfo
 
 logger = logging.getLogger(__name__)
 
+# How long a successful STS GetCallerIdentity result is reused for the same credentials
+IDENTITY_CACHE_TTL_SECONDS = 300
+
+# How long the account listing is served from memory; writes through this service invalidate it immediately
+ACCOUNT_CACHE_TTL_SECONDS = 30
+
+
+def _copy_account(account: AWSAccount) -> AWSAccount:
+    """Copy a cached account so callers' changes don't reach other readers"""
+    return AWSAccount(metadata=copy.copy(account.metadata), credentials=account.credentials)
+
 
 class AWSAccountApplicationService(AWSAccountServicePort):
     """Application service for AWS account management"""
@@ -15,10 +30,105 @@ class AWSAccountApplicationService(AWSAccountServicePort):
     def __init__(
         self,
         account_repository: AWSAccountRepositoryPort,
-        aws_client: AWSClientPort
+        aws_client: AWSClientPort,
+        account_cache_ttl: float = ACCOUNT_CACHE_TTL_SECONDS
     ):
         self._account_repository = account_repository
         self._aws_client = aws_client
+        
+        # (monotonic expiry, accounts, accounts by alias); bumping the version
+        # on every write keeps an in-flight refresh from caching stale data
+        self._account_cache_ttl = account_cache_ttl
+        self._accounts_cache: Optional[Tuple[float, List[AWSAccount], Dict[str, AWSAccount]]] = None
+        self._accounts_version = 0
+        self._accounts_cache_lock = asyncio.Lock()
+        
+        # Credentials fingerprint -> (caller identity, monotonic expiry), plus
+        # the STS lookups currently running so concurrent callers share one
+        self._identity_cache: Dict[str, Tuple[AWSAccountInfo, float]] = {}
+        self._identity_inflight: Dict[str, asyncio.Task] = {}
+
+    async def _describe_credentials(self, credentials: AWSCredentials) -> AWSAccountInfo:
+        """
+        Validate credentials and return their caller identity with one STS call.
+
+        A successful GetCallerIdentity response is the validation signal, so
+        there is no separate validate_credentials round-trip. Results are
+        cached per credentials for IDENTITY_CACHE_TTL_SECONDS, and concurrent
+        calls for the same credentials share one in-flight request.
+
+        Raises:
+            ValueError: If the credentials are rejected or STS can't be reached
+        """
+        key = credentials.fingerprint()
+        
+        cached = self._identity_cache.get(key)
+        if cached and cached[1] > time.monotonic():
+            return cached[0]
+        
+        task = self._identity_inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._fetch_identity(key, credentials))
+            self._identity_inflight[key] = task
+            task.add_done_callback(lambda done: self._identity_lookup_finished(key, done))
+        
+        # A cancelled caller must not cancel the lookup other callers are sharing
+        return await asyncio.shield(task)
+
+    async def _fetch_identity(self, key: str, credentials: AWSCredentials) -> AWSAccountInfo:
+        """Call STS GetCallerIdentity and cache a successful result"""
+        try:
+            account_info = await self._aws_client.validate_and_describe(credentials)
+        except Exception as e:
+            logger.warning(f"Credential validation failed: {e}")
+            raise ValueError("Invalid AWS credentials provided") from e
+        if account_info is None:
+            logger.warning("Credential validation failed: credentials were rejected")
+            raise ValueError("Invalid AWS credentials provided")
+        
+        # Drop expired entries so rotated credentials don't accumulate
+        now = time.monotonic()
+        self._identity_cache = {
+            k: entry for k, entry in self._identity_cache.items() if entry[1] > now
+        }
+        self._identity_cache[key] = (account_info, now + IDENTITY_CACHE_TTL_SECONDS)
+        return account_info
+
+    def _identity_lookup_finished(self, key: str, task: asyncio.Task) -> None:
+        """Forget a finished STS lookup"""
+        self._identity_inflight.pop(key, None)
+        # Mark the error as retrieved in case every waiter was cancelled
+        if not task.cancelled():
+            task.exception()
+
+    async def _cached_accounts(self) -> Tuple[List[AWSAccount], Dict[str, AWSAccount]]:
+        """Return all accounts and an alias index, refreshing them at most once per TTL"""
+        cached = self._accounts_cache
+        if cached and cached[0] > time.monotonic():
+            return cached[1], cached[2]
+        
+        # Only one refresh runs at a time; waiters pick up its result
+        async with self._accounts_cache_lock:
+            cached = self._accounts_cache
+            if cached and cached[0] > time.monotonic():
+                return cached[1], cached[2]
+            
+            version = self._accounts_version
+            accounts = await self._account_repository.list_accounts()
+            by_alias = {account.alias: account for account in accounts}
+            if version == self._accounts_version:
+                self._accounts_cache = (time.monotonic() + self._account_cache_ttl, accounts, by_alias)
+            return accounts, by_alias
+
+    def _invalidate_accounts(self) -> None:
+        """Drop the cached account listing after a write"""
+        self._accounts_version += 1
+        self._accounts_cache = None
+
+    async def _account_exists(self, alias: str) -> bool:
+        """Check an alias against the cached account listing"""
+        _, by_alias = await self._cached_accounts()
+        return alias in by_alias
 
     async def register_account(
         self, 
@@ -28,21 +138,22 @@ class AWSAccountApplicationService(AWSAccountServicePort):
         set_as_default: bool = False
     ) -> AWSAccount:
         """Register a new AWS account with credentials"""
-        # Check if alias already exists
-        if await self._account_repository.account_exists(alias):
-            raise ValueError(f"Account with alias '{alias}' already exists")
-        
-        # Validate credentials by making an AWS call
-        if not await self._aws_client.validate_credentials(credentials):
-            raise ValueError("Invalid AWS credentials provided")
+        # Check the alias and validate credentials concurrently; the repository
+        # lookup and the STS call are independent, so their latencies overlap
+        exists, account_info = await asyncio.gather(
+            self._account_exists(alias),
+            self._describe_credentials(credentials),
+            return_exceptions=True
+        )
         
-        # Get account info to store account ID
-        try:
-            account_info = await self._aws_client.get_caller_identity(credentials)
-            account_id = account_info.account_id
-        except Exception as e:
-            logger.warning(f"Could not retrieve account ID for alias '{alias}': {e}")
-            account_id = None
+        # Report a duplicate alias ahead of invalid credentials
+        if isinstance(exists, BaseException):
+            raise exists
+        if exists:
+            raise ValueError(f"Account with alias '{alias}' already exists")
+        if isinstance(account_info, BaseException):
+            raise account_info
+        account_id = account_info.account_id
         
         # Create account entity
         account = AWSAccount.create(
@@ -50,74 +161,81 @@ class AWSAccountApplicationService(AWSAccountServicePort):
             credentials=credentials,
             account_id=account_id,
             description=description,
-            is_default=False  # We'll set this after saving if needed
+            is_default=False  # The repository sets this while saving if needed
         )
         
-        # Save the account
-        saved_account = await self._account_repository.save_account(account)
-        
-        # Set as default if requested
-        if set_as_default:
-            await self._account_repository.set_default_account(alias)
-            saved_account.mark_as_default()
+        # Save the account, taking over the default flag in the same write if requested
+        try:
+            saved_account = await self._account_repository.save_account(account, make_default=set_as_default)
+        finally:
+            self._invalidate_accounts()
         
         logger.info(f"Registered AWS account '{alias}' with account ID '{account_id}'")
         return saved_account
 
     async def update_account_credentials(self, alias: str, credentials: AWSCredentials) -> AWSAccount:
         """Update credentials for an existing account"""
-        # Get existing account
-        account = await self._account_repository.get_account_by_alias(alias)
+        # Load the existing account while validating the new credentials
+        account, account_info = await asyncio.gather(
+            self._account_repository.get_account_by_alias(alias),
+            self._describe_credentials(credentials),
+            return_exceptions=True
+        )
+        
+        if isinstance(account, BaseException):
+            raise account
         if not account:
             raise ValueError(f"Account with alias '{alias}' not found")
+        if isinstance(account_info, BaseException):
+            raise account_info
         
-        # Validate new credentials
-        if not await self._aws_client.validate_credentials(credentials):
-            raise ValueError("Invalid AWS credentials provided")
-        
-        # Update account with new credentials and account ID
-        try:
-            account_info = await self._aws_client.get_caller_identity(credentials)
-            account.update_account_id(account_info.account_id)
-        except Exception as e:
-            logger.warning(f"Could not retrieve account ID for alias '{alias}': {e}")
-        
-        await account.update_credentials(credentials)
+        # One timestamp for both metadata changes
+        now = datetime.utcnow()
+        account.update_account_id(account_info.account_id, now)
+        await account.update_credentials(credentials, now)
         
         # Save updated account
-        updated_account = await self._account_repository.save_account(account)
+        try:
+            updated_account = await self._account_repository.save_account(account)
+        finally:
+            self._invalidate_accounts()
         
         logger.info(f"Updated credentials for AWS account '{alias}'")
         return updated_account
 
     async def get_account(self, alias: str) -> Optional[AWSAccount]:
         """Get an AWS account by alias"""
-        return await self._account_repository.get_account_by_alias(alias)
+        _, by_alias = await self._cached_accounts()
+        account = by_alias.get(alias)
+        return _copy_account(account) if account else None
 
     async def list_accounts(self) -> List[AWSAccount]:
         """List all registered AWS accounts"""
-        return await self._account_repository.list_accounts()
+        accounts, _ = await self._cached_accounts()
+        return [_copy_account(account) for account in accounts]
 
     async def delete_account(self, alias: str) -> bool:
         """Delete an AWS account"""
-        # Check if account exists
-        account = await self._account_repository.get_account_by_alias(alias)
+        # One listing gives both the account and the candidates for a new default
+        accounts, by_alias = await self._cached_accounts()
+        account = by_alias.get(alias)
         if not account:
             return False
         
-        # If this is the default account, we need to handle that
+        # If this is the default account, make the first other account the
+        # default, or leave none as default
+        new_default_alias = None
         if account.is_default:
-            # Find another account to make default, or leave none as default
-            all_accounts = await self._account_repository.list_accounts()
-            other_accounts = [acc for acc in all_accounts if acc.alias != alias]
-            
-            if other_accounts:
-                # Make the first other account the default
-                await self._account_repository.set_default_account(other_accounts[0].alias)
-                logger.info(f"Made account '{other_accounts[0].alias}' the new default after deleting '{alias}'")
+            new_default_alias = next((acc.alias for acc in accounts if acc.alias != alias), None)
         
-        # Delete the account
-        success = await self._account_repository.delete_account(alias)
+        # Delete the account and promote the new default in one transaction
+        try:
+            success = await self._account_repository.delete_account(alias, new_default_alias)
+        finally:
+            self._invalidate_accounts()
+        
+        if success and new_default_alias:
+            logger.info(f"Made account '{new_default_alias}' the new default after deleting '{alias}'")
         
         if success:
             logger.info(f"Deleted AWS account '{alias}'")
@@ -126,15 +244,20 @@ class AWSAccountApplicationService(AWSAccountServicePort):
 
     async def get_default_account(self) -> Optional[AWSAccount]:
         """Get the default AWS account"""
-        return await self._account_repository.get_default_account()
+        accounts, _ = await self._cached_accounts()
+        account = next((account for account in accounts if account.is_default), None)
+        return _copy_account(account) if account else None
 
     async def set_default_account(self, alias: str) -> bool:
         """Set an account as the default"""
         # Check if account exists
-        if not await self._account_repository.account_exists(alias):
+        if not await self._account_exists(alias):
             raise ValueError(f"Account with alias '{alias}' not found")
         
-        success = await self._account_repository.set_default_account(alias)
+        try:
+            success = await self._account_repository.set_default_account(alias)
+        finally:
+            self._invalidate_accounts()
         
         if success:
             logger.info(f"Set AWS account '{alias}' as default")
@@ -143,10 +266,15 @@ class AWSAccountApplicationService(AWSAccountServicePort):
 
     async def validate_account_credentials(self, alias: str) -> bool:
         """Validate credentials for a specific account"""
-        account = await self._account_repository.get_account_by_alias(alias)
+        account = await self.get_account(alias)
         if not account:
             return False
         
         if not account.credentials:
             return False
-        return await self._aws_client.validate_credentials(account.credentials) 
\ No newline at end of file
+        
+        try:
+            await self._describe_credentials(account.credentials)
+        except ValueError:
+            return False
+        return True 
\ No newline at end of file
@@ -1,37 +1,112 @@
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterable, Optional, Tuple
 from core.ports.inbound.aws_service_port import AWSServicePort
+from core.ports.inbound.aws_account_service_port import AWSAccountServicePort
 from core.ports.outbound.aws_account_repository_port import AWSAccountRepositoryPort
 from core.domain.entities.aws_resource import AWSResource, ResourceType
+from core.domain.entities.aws_account import AWSAccount
 from core.domain.value_objects.aws_credentials import AWSAccountInfo, AWSCredentials
 from core.use_cases.aws_analysis_use_case import AWSAnalysisUseCase
 from core.ports.outbound.mcp_reinitialization_port import MCPReinitializationPort
+import asyncio
 import os
+import time
 from infrastructure.config import get_config
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Quiet period before a follow-up MCP restart, so a burst of account switches shares one restart
+MCP_REINIT_DEBOUNCE_SECONDS = 0.15
+
+# How long STS account information is reused for the same credentials
+ACCOUNT_INFO_TTL_SECONDS = 300
+
+
+def _apply_environment(environment: Iterable[Tuple[str, Optional[str]]]) -> List[str]:
+    """
+    Bring os.environ in line with the given (name, value) pairs, where None means unset.
+
+    Only keys whose value actually differs are written, so switching to the
+    same credentials again does not touch the process environment.
+    Returns the names of the variables that changed.
+    """
+    changed = []
+    for key, value in environment:
+        if os.environ.get(key) == value:
+            continue
+        if value is None:
+            del os.environ[key]
+        else:
+            os.environ[key] = value
+        changed.append(key)
+    return changed
+
 
 class AWSApplicationService(AWSServicePort):
     """Application service for AWS operations with multi-account support"""
 
+    __slots__ = (
+        "_aws_analysis_use_case",
+        "_account_repository",
+        "_aws_account_service",
+        "_mcp_reinitialization_port",
+        "_default_credentials",
+        "_active_account_alias",
+        "_default_environment",
+        "_mcp_reinit_task",
+        "_mcp_reinit_requested",
+        "_mcp_environment_stale",
+        "_account_info_cache",
+    )
+
     def __init__(
         self,
         aws_analysis_use_case: AWSAnalysisUseCase,
         account_repository: AWSAccountRepositoryPort,
         mcp_reinitialization_port: Optional[MCPReinitializationPort] = None,
-        default_credentials: AWSCredentials = None
+        default_credentials: AWSCredentials = None,
+        aws_account_service: Optional[AWSAccountServicePort] = None
     ):
         self._aws_analysis_use_case = aws_analysis_use_case
         self._account_repository = account_repository
+        # Account lookups go through the account service when given, whose
+        # cached listing is invalidated by every account write
+        self._aws_account_service = aws_account_service
         self._mcp_reinitialization_port = mcp_reinitialization_port
         self._default_credentials = default_credentials
         self._active_account_alias: Optional[str] = None
+        
+        # Environment restored when no account is active; read from the config
+        # on first use, so a config initialized after this service is honoured
+        self._default_environment: Optional[Tuple[Tuple[str, Optional[str]], ...]] = None
+        
+        # Background MCP reinitialization; a change arriving while one runs
+        # sets the flag so a single follow-up pass picks it up
+        self._mcp_reinit_task: Optional[asyncio.Task] = None
+        self._mcp_reinit_requested = False
+        # Set when the last reinitialization failed, so MCP servers may not
+        # have the current environment even though os.environ is up to date
+        self._mcp_environment_stale = False
+        
+        # Credentials fingerprint -> (account info, monotonic expiry); only
+        # successful lookups are kept, so invalid credentials are re-checked
+        self._account_info_cache: Dict[str, Tuple[AWSAccountInfo, float]] = {}
+
+    async def _lookup_account(self, alias: Optional[str]) -> Optional[AWSAccount]:
+        """Get an account by alias, or the default account"""
+        if self._aws_account_service:
+            if alias is None:
+                return await self._aws_account_service.get_default_account()
+            return await self._aws_account_service.get_account(alias)
+        
+        if alias is None:
+            return await self._account_repository.get_default_account()
+        return await self._account_repository.get_account_by_alias(alias)
 
     async def set_active_account(self, account_alias: str) -> None:
         """Set active AWS account for current session"""
-        # Get account from repository
-        account = await self._account_repository.get_account_by_alias(account_alias)
+        # Get account from the account service or repository
+        account = await self._lookup_account(account_alias)
         if not account:
             raise ValueError(f"Account with alias '{account_alias}' not found")
         
@@ -45,94 +120,95 @@ class AWSApplicationService(AWSServicePort):
         self._active_account_alias = account_alias
         
         # Update environment variables for MCP tools
-        await self._update_environment_with_credentials(account.credentials)
+        self._update_environment_with_credentials(account.credentials)
         
-        logger.info(f"Set active AWS account to '{account_alias}' (Account ID: {account.account_id})")
-        logger.info(f"Using credential type: {'profile' if account.credentials.uses_profile() else 'access keys'}")
-        logger.info("Successfully updated environment variables with account credentials")
+        if logger.isEnabledFor(logging.INFO):
+            # The account metadata already records the credential type
+            credential_type = "profile" if account.uses_profile else "access keys"
+            logger.info(f"Set active AWS account to '{account_alias}' (Account ID: {account.account_id})")
+            logger.info(f"Using credential type: {credential_type}")
+            logger.info("Successfully updated environment variables with account credentials")
 
     async def clear_active_account(self) -> None:
         """Clear active AWS account"""
         self._active_account_alias = None
-        await self._restore_default_environment()
+        self._restore_default_environment()
         logger.info("Cleared active AWS account")
 
     def get_active_account_alias(self) -> Optional[str]:
         """Get current active account alias"""
         return self._active_account_alias
 
-    async def _update_environment_with_credentials(self, credentials: AWSCredentials) -> None:
+    def _update_environment_with_credentials(self, credentials: AWSCredentials) -> None:
         """Update environment variables with credentials"""
         logger.info(f"Updating environment variables with credentials for region: {credentials.region}")
         
-        if credentials.uses_keys():
-            logger.info("Setting environment variables for access key credentials")
-            os.environ["AWS_ACCESS_KEY_ID"] = credentials.access_key_id or ""
-            os.environ["AWS_SECRET_ACCESS_KEY"] = credentials.secret_access_key or ""
-            if credentials.session_token:
-                os.environ["AWS_SESSION_TOKEN"] = credentials.session_token
-                logger.info("Set AWS_SESSION_TOKEN (temporary credentials)")
-            else:
-                os.environ.pop("AWS_SESSION_TOKEN", None)
-                logger.info("Cleared AWS_SESSION_TOKEN (permanent credentials)")
-            os.environ.pop("AWS_PROFILE", None)
-            logger.info("Cleared AWS_PROFILE (using access keys)")
-        elif credentials.uses_profile():
-            logger.info(f"Setting environment variables for profile credentials: {credentials.profile}")
-            os.environ["AWS_PROFILE"] = credentials.profile or ""
-            os.environ.pop("AWS_ACCESS_KEY_ID", None)
-            os.environ.pop("AWS_SECRET_ACCESS_KEY", None)
-            os.environ.pop("AWS_SESSION_TOKEN", None)
-            logger.info("Cleared explicit credential environment variables (using profile)")
-        
-        os.environ["AWS_DEFAULT_REGION"] = credentials.region
-        logger.info(f"Set AWS_DEFAULT_REGION to: {credentials.region}")
+        changed = _apply_environment(credentials.environment_variables())
+        if not changed and not self._mcp_environment_stale:
+            # MCP servers already run with exactly this environment
+            logger.info("AWS environment variables already match; skipping MCP reinitialization")
+            return
+        logger.info(f"Updated AWS environment variables: {', '.join(changed) or 'none changed'}")
         
         # Reinitialize MCP servers with new credentials
-        if self._mcp_reinitialization_port:
-            try:
-                logger.info("Reinitializing MCP servers with new credentials")
-                await self._mcp_reinitialization_port.reinitialize_with_new_credentials()
-                logger.info("MCP servers reinitialized successfully")
-            except Exception as e:
-                logger.warning(f"MCP reinitialization failed: {e}")
+        self._schedule_mcp_reinitialization()
 
-    async def _restore_default_environment(self) -> None:
+    def _restore_default_environment(self) -> None:
         """Restore default environment variables"""
-        config = get_config()
+        if self._default_environment is None:
+            aws_config = get_config().aws
+            self._default_environment = (
+                ("AWS_ACCESS_KEY_ID", aws_config.access_key_id or None),
+                ("AWS_SECRET_ACCESS_KEY", aws_config.secret_access_key or None),
+                ("AWS_SESSION_TOKEN", aws_config.session_token or None),
+                ("AWS_PROFILE", aws_config.profile or None),
+                ("AWS_DEFAULT_REGION", aws_config.default_region),
+            )
         
-        if config.aws.access_key_id:
-            os.environ["AWS_ACCESS_KEY_ID"] = config.aws.access_key_id
-        else:
-            os.environ.pop("AWS_ACCESS_KEY_ID", None)
-            
-        if config.aws.secret_access_key:
-            os.environ["AWS_SECRET_ACCESS_KEY"] = config.aws.secret_access_key
-        else:
-            os.environ.pop("AWS_SECRET_ACCESS_KEY", None)
-            
-        if config.aws.session_token:
-            os.environ["AWS_SESSION_TOKEN"] = config.aws.session_token
-        else:
-            os.environ.pop("AWS_SESSION_TOKEN", None)
-            
-        if config.aws.profile:
-            os.environ["AWS_PROFILE"] = config.aws.profile
-        else:
-            os.environ.pop("AWS_PROFILE", None)
-            
-        os.environ["AWS_DEFAULT_REGION"] = config.aws.default_region
+        if _apply_environment(self._default_environment) or self._mcp_environment_stale:
+            self._schedule_mcp_reinitialization()
+
+    def _schedule_mcp_reinitialization(self) -> None:
+        """Reinitialize MCP servers in the background so credential switches return immediately"""
+        if not self._mcp_reinitialization_port:
+            return
+        
+        # Don't cancel a restart midway; coalesce into one more pass instead
+        if self._mcp_reinit_task and not self._mcp_reinit_task.done():
+            self._mcp_reinit_requested = True
+            return
         
-        if self._mcp_reinitialization_port:
+        self._mcp_reinit_task = asyncio.create_task(self._reinitialize_mcp())
+
+    async def _reinitialize_mcp(self) -> None:
+        """Run MCP reinitialization until no further credential change is pending"""
+        while True:
+            self._mcp_reinit_requested = False
             try:
+                logger.info("Reinitializing MCP servers with new credentials")
                 await self._mcp_reinitialization_port.reinitialize_with_new_credentials()
+                self._mcp_environment_stale = False
+                logger.info("MCP servers reinitialized successfully")
             except Exception as e:
+                self._mcp_environment_stale = True
                 logger.warning(f"MCP reinitialization failed: {e}")
+            if not self._mcp_reinit_requested:
+                return
+            # More switches arrived during the restart; let the burst settle
+            # so changes landing during the wait share the follow-up pass
+            await asyncio.sleep(MCP_REINIT_DEBOUNCE_SECONDS)
+
+    async def wait_ready(self) -> None:
+        """Wait for any pending MCP reinitialization to finish"""
+        # asyncio.wait neither raises nor cancels the reinitialization when
+        # the waiter itself is cancelled
+        while self._mcp_reinit_task and not self._mcp_reinit_task.done():
+            await asyncio.wait({self._mcp_reinit_task})
 
     async def _get_credentials_for_account(self, account_alias: Optional[str] = None) -> AWSCredentials:
         """Get credentials for the specified account or active account"""
         if account_alias:
-            account = await self._account_repository.get_account_by_alias(account_alias)
+            account = await self._lookup_account(account_alias)
             if not account:
                 raise ValueError(f"Account with alias '{account_alias}' not found")
             # Load credentials from memory
@@ -141,7 +217,7 @@ class AWSApplicationService(AWSServicePort):
                 raise ValueError(f"No credentials available for account '{account_alias}'. Please re-enter credentials via the UI.")
             return account.credentials
         elif self._active_account_alias:
-            account = await self._account_repository.get_account_by_alias(self._active_account_alias)
+            account = await self._lookup_account(self._active_account_alias)
             if not account:
                 raise ValueError(f"Active account '{self._active_account_alias}' not found")
             # Load credentials from memory
@@ -151,7 +227,7 @@ class AWSApplicationService(AWSServicePort):
             return account.credentials
         else:
             # Fall back to default account or session credentials
-            default_account = await self._account_repository.get_default_account()
+            default_account = await self._lookup_account(None)
             if default_account:
                 credentials_loaded = await default_account.load_credentials()
                 if credentials_loaded and default_account.credentials:
@@ -165,7 +241,22 @@ class AWSApplicationService(AWSServicePort):
     async def get_account_info(self, account_alias: Optional[str] = None) -> AWSAccountInfo:
         """Get AWS account information"""
         creds = await self._get_credentials_for_account(account_alias)
-        return await self._aws_analysis_use_case.get_account_info(creds)
+        
+        # Page loads ask for the same identity repeatedly; reuse the STS answer
+        key = creds.fingerprint()
+        now = time.monotonic()
+        cached = self._account_info_cache.get(key)
+        if cached and cached[1] > now:
+            return cached[0]
+        
+        account_info = await self._aws_analysis_use_case.get_account_info(creds)
+        
+        # Drop expired entries so rotated credentials don't accumulate
+        self._account_info_cache = {
+            k: entry for k, entry in self._account_info_cache.items() if entry[1] > now
+        }
+        self._account_info_cache[key] = (account_info, time.monotonic() + ACCOUNT_INFO_TTL_SECONDS)
+        return account_info
 
     async def list_resources(self, resource_type: ResourceType, region: str = None, account_alias: Optional[str] = None) -> List[AWSResource]:
         """List AWS resources of a specific type"""
@@ -203,12 +294,3 @@ class AWSApplicationService(AWSServicePort):
             })
         
         return recommendations
-
-    def _get_credentials(self) -> AWSCredentials:
-        """Get AWS credentials from session state or default (deprecated)"""
-        # Priority: session credentials -> default credentials -> environment credentials
-        if self._default_credentials:
-            return self._default_credentials
-        
-        # Default to environment credentials
-        return AWSCredentials(region="us-east-1") 
\ No newline at end of file
@@ -1,54 +1,76 @@
-import uuid
+import re
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from src.core.ports.inbound.chat_service_port import ChatServicePort
 from src.core.ports.outbound.chat_repository_port import ChatRepositoryPort
 from src.core.ports.inbound.aws_service_port import AWSServicePort
 from src.core.ports.inbound.aws_account_service_port import AWSAccountServicePort
-from src.core.domain.entities.chat import ChatMessage, Conversation
-from src.infrastructure.logging import get_logger, log_operation
+from src.core.domain.entities.chat import MESSAGE_ROLES, ChatMessage, Conversation
+from src.core.domain.exceptions import ConversationNotFoundError
+from src.core.domain.identifiers import new_id
+from src.infrastructure.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Leading phrases dropped from a first message to form a conversation title, checked in order
+_TITLE_PREFIXES = (
+    "can you", "could you", "please", "i need", "i want", "help me",
+    "analyze", "check", "show me", "tell me", "what", "how", "why"
+)
+# Alternatives are tried in the order above; trailing whitespace is consumed with the prefix
+_TITLE_PREFIX_RE = re.compile(
+    "(?:" + "|".join(map(re.escape, _TITLE_PREFIXES)) + r")\s*", re.IGNORECASE
+)
+
+
 class ChatApplicationService(ChatServicePort):
     """Application service for chat operations."""
     
+    __slots__ = ("chat_repository", "aws_service", "aws_account_service")
+    
     def __init__(self, chat_repository: ChatRepositoryPort, aws_service: Optional[AWSServicePort] = None, aws_account_service: Optional[AWSAccountServicePort] = None):
         self.chat_repository = chat_repository
         self.aws_service = aws_service
         self.aws_account_service = aws_account_service
     
-    async def create_conversation(self, title: str, account_alias: Optional[str] = None) -> Conversation:
-        """Create a new conversation with auto-generated ID."""
-        now = datetime.now()
+    async def _resolve_account_id(self, account_alias: Optional[str]) -> str:
+        """Resolve the account ID to record on a new conversation.
         
-        # Get account alias from AWS service if not provided
+        Falls back to the active account alias, then to the alias itself (or
+        "default") when it can't be resolved. The account service keeps
+        accounts in memory, so this doesn't normally touch the database.
+        """
+        # Get account alias from AWS service if not provided; this is a plain
+        # attribute read, so there is nothing to overlap with other work
         if not account_alias and self.aws_service:
             try:
-                account_alias = await self.aws_service.get_active_account_alias()
+                account_alias = self.aws_service.get_active_account_alias()
             except Exception:
                 pass  # Continue without account alias if service unavailable
         
         # Use default if still no account alias
         if not account_alias:
-            account_alias = "default"
+            return "default"
         
-        # Resolve account alias to account ID
-        account_id = account_alias  # Default fallback
+        # Resolve account alias to account ID, using the alias as fallback
         if self.aws_account_service and account_alias != "default":
             try:
                 account = await self.aws_account_service.get_account(account_alias)
                 if account and account.account_id:
-                    account_id = account.account_id
-                else:
-                    # If account not found or no account_id, use alias as fallback
-                    account_id = account_alias
+                    return account.account_id
             except Exception:
-                # If error resolving account, use alias as fallback
-                account_id = account_alias
+                pass  # Fall back to the alias if the account can't be resolved
+        
+        return account_alias
+    
+    async def create_conversation(self, title: str, account_alias: Optional[str] = None) -> Conversation:
+        """Create a new conversation with auto-generated ID."""
+        now = datetime.now()
+        
+        account_id = await self._resolve_account_id(account_alias)
         
         conversation = Conversation(
-            id=str(uuid.uuid4()),
+            id=new_id(),
             title=title,
             account_id=account_id,
             created_at=now,
@@ -57,100 +79,61 @@ class ChatApplicationService(ChatServicePort):
         
         result = await self.chat_repository.create_conversation(conversation)
         
-        log_operation(
-            logger=logger,
-            operation_type="create_conversation",
-            entity_id=result.id,
-            success=True,
-            details={"title": title}
-        )
-        
         return result
     
     async def get_conversation(self, conversation_id: str) -> Optional[Conversation]:
         """Get conversation by ID."""
         return await self.chat_repository.get_conversation(conversation_id)
     
-    async def list_conversations(self, limit: int = 50, offset: int = 0) -> List[Conversation]:
+    async def list_conversations(self, limit: int = 50, offset: int = 0,
+                                 cursor: Optional[Tuple[datetime, str]] = None) -> List[Conversation]:
         """List conversations with pagination."""
-        return await self.chat_repository.list_conversations(limit, offset)
+        return await self.chat_repository.list_conversations(limit, offset, cursor)
     
     async def update_conversation_title(self, conversation_id: str, title: str) -> Optional[Conversation]:
         """Update conversation title."""
-        conversation = await self.chat_repository.get_conversation(conversation_id)
-        if not conversation:
+        result = await self.chat_repository.update_conversation_title(conversation_id, title, datetime.now())
+        if not result:
             return None
         
-        conversation.title = title
-        conversation.updated_at = datetime.now()
-        
-        result = await self.chat_repository.update_conversation(conversation)
-        
-        log_operation(
-            logger=logger,
-            operation_type="update_conversation_title",
-            entity_id=conversation_id,
-            success=True,
-            details={"new_title": title}
-        )
-        
         return result
     
     async def delete_conversation(self, conversation_id: str) -> bool:
         """Delete conversation and all its messages."""
         success = await self.chat_repository.delete_conversation(conversation_id)
         
-        log_operation(
-            logger=logger,
-            operation_type="delete_conversation",
-            entity_id=conversation_id,
-            success=success
-        )
-        
         return success
     
     async def add_message_to_conversation(self, conversation_id: str, role: str, content: str) -> ChatMessage:
         """Add message to conversation."""
-        # Verify conversation exists
-        conversation = await self.chat_repository.get_conversation(conversation_id)
-        if not conversation:
-            raise ValueError(f"Conversation {conversation_id} not found")
-        
         message = ChatMessage(
-            id=str(uuid.uuid4()),
+            id=new_id(),
             conversation_id=conversation_id,
-            role=role,  # type: ignore
+            role=MESSAGE_ROLES.get(role, role),  # type: ignore
             content=content,
             timestamp=datetime.now()
         )
         
-        result = await self.chat_repository.add_message(message)
-        
-        log_operation(
-            logger=logger,
-            operation_type="add_message",
-            entity_id=result.id,
-            success=True,
-            details={
-                "conversation_id": conversation_id,
-                "role": role,
-                "content_length": len(content)
-            }
-        )
+        # The repository rejects messages for a missing conversation
+        try:
+            result = await self.chat_repository.add_message(message)
+        except ConversationNotFoundError as e:
+            raise ValueError(f"Conversation {conversation_id} not found") from e
         
         return result
     
-    async def get_conversation_messages(self, conversation_id: str, limit: int = 100, offset: int = 0) -> List[ChatMessage]:
+    async def get_conversation_messages(self, conversation_id: str, limit: int = 100, offset: int = 0,
+                                        cursor: Optional[Tuple[datetime, str]] = None) -> List[ChatMessage]:
         """Get messages for a conversation with pagination."""
-        return await self.chat_repository.get_messages(conversation_id, limit, offset)
+        return await self.chat_repository.get_messages(conversation_id, limit, offset, cursor)
     
     async def get_or_create_default_conversation(self) -> Conversation:
         """Get or create a default conversation for the session."""
         # Try to get the most recent conversation
-        conversations = await self.chat_repository.list_conversations(limit=1, offset=0)
+        conversation = await self.chat_repository.get_most_recent_conversation()
         
-        if conversations:
-            return conversations[0]
+        if conversation:
+            return conversation
         
         # Create a default conversation if none exist
         return await self.create_conversation("New Conversation")
@@ -161,30 +144,23 @@ class ChatApplicationService(ChatServicePort):
         title = first_message.strip()
         
         # Remove common prefixes
-        prefixes_to_remove = [
-            "can you", "could you", "please", "i need", "i want", "help me",
-            "analyze", "check", "show me", "tell me", "what", "how", "why"
-        ]
+        match = _TITLE_PREFIX_RE.match(title)
+        if match:
+            title = title[match.end():]
         
-        title_lower = title.lower()
-        for prefix in prefixes_to_remove:
-            if title_lower.startswith(prefix):
-                title = title[len(prefix):].strip()
-                break
+        # Capitalize first letter; upper() can lengthen it (e.g. "ß" -> "SS")
+        first = title[:1].upper()
+        length = len(title) + len(first) - len(title[:1])
         
-        # Capitalize first letter
-        if title:
-            title = title[0].upper() + title[1:]
+        # Fallback if title is empty or too short
+        if length < 3:
+            return "New Conversation"
         
-        # Truncate to reasonable length
-        if len(title) > 50:
-            title = title[:47] + "..."
+        # Truncate to reasonable length without copying the rest of a long message
+        if length > 50:
+            return (first + title[1:47])[:47] + "..."
         
-        # Fallback if title becomes empty or too short
-        if len(title) < 3:
-            title = "New Conversation"
-            
-        return title
+        return first + title[1:]
     
     async def create_conversation_from_message(self, first_message: str, account_alias: Optional[str] = None) -> Conversation:
         """Create a new conversation with a title generated from the first message."""
@@ -206,34 +182,11 @@ class ChatApplicationService(ChatServicePort):
         if not title:
             title = self._generate_conversation_title(user_message)
         
-        # Get account alias from AWS service if not provided
-        if not account_alias and self.aws_service:
-            try:
-                account_alias = await self.aws_service.get_active_account_alias()
-            except Exception:
-                pass  # Continue without account alias if service unavailable
-        
-        # Use default if still no account alias
-        if not account_alias:
-            account_alias = "default"
-        
-        # Resolve account alias to account ID
-        account_id = account_alias  # Default fallback
-        if self.aws_account_service and account_alias != "default":
-            try:
-                account = await self.aws_account_service.get_account(account_alias)
-                if account and account.account_id:
-                    account_id = account.account_id
-                else:
-                    # If account not found or no account_id, use alias as fallback
-                    account_id = account_alias
-            except Exception:
-                # If error resolving account, use alias as fallback
-                account_id = account_alias
+        account_id = await self._resolve_account_id(account_alias)
         
         # Create entities
         conversation = Conversation(
-            id=str(uuid.uuid4()),
+            id=new_id(),
             title=title,
             account_id=account_id,
             created_at=now,
@@ -241,7 +194,7 @@ class ChatApplicationService(ChatServicePort):
         )
         
         first_message = ChatMessage(
-            id=str(uuid.uuid4()),
+            id=new_id(),
             conversation_id=conversation.id,
             role="user",
             content=user_message,
@@ -253,15 +206,4 @@ class ChatApplicationService(ChatServicePort):
             conversation, first_message
         )
         
-        log_operation(
-            logger=logger,
-            operation_type="create_conversation_with_first_message",
-            entity_id=result_conversation.id,
-            success=True,
-            details={
-                "title": title,
-                "message_length": len(user_message)
-            }
-        )
-        
         return result_conversation, result_message 
\ No newline at end of file
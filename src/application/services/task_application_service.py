@@ -1,8 +1,11 @@
 import asyncio
-import uuid
-from typing import List, Optional
+import logging
+from datetime import datetime
+from typing import List, Optional, Tuple
 from core.ports.inbound.task_service_port import TaskServicePort
 from core.domain.entities.task import Task, TaskStatus
+from core.domain.identifiers import new_id
+from core.ports.inbound.aws_service_port import AWSServicePort
 from core.use_cases.execute_task_use_case import ExecuteTaskUseCase
 from core.ports.outbound.task_repository_port import TaskRepositoryPort
 from infrastructure.logging import get_logger
@@ -14,10 +17,12 @@ class TaskApplicationService(TaskServicePort):
     def __init__(
         self,
         execute_task_use_case: ExecuteTaskUseCase,
-        task_repository: TaskRepositoryPort
+        task_repository: TaskRepositoryPort,
+        aws_service: Optional[AWSServicePort] = None
     ):
         self._execute_task_use_case = execute_task_use_case
         self._task_repository = task_repository
+        self._aws_service = aws_service
         self._logger = get_logger(__name__)
 
     async def execute_task(self, description: str) -> Task:
@@ -28,7 +33,7 @@ class TaskApplicationService(TaskServicePort):
         """Execute a cloud engineering task asynchronously (returns task ID immediately)"""
         # Create task with pending status
         task = Task(
-            id=str(uuid.uuid4()),
+            id=new_id(),
             description=description,
             status=TaskStatus.PENDING
         )
@@ -44,20 +49,15 @@ class TaskApplicationService(TaskServicePort):
 
     async def _execute_task_background(self, task_id: str, description: str):
         """Execute task in background and update status"""
-        self._logger.info(f"task_background_started | task_id=<{task_id}> | description=<{description[:100]}...>")
-        
+        self._logger.info("task_background_started | task_id=<%s> | description=<%.100s...>", task_id, description)
         
         try:
-            # Get the task to update
-            task = await self._task_repository.get_task_by_id(task_id)
+            # Mark as in progress; a task cancelled before it started is left alone
+            task = await self._task_repository.mark_in_progress_if_pending(task_id)
             if not task:
-                self._logger.error(f"task_not_found | task_id=<{task_id}>")
+                self._logger.error(f"task_not_pending | task_id=<{task_id}>")
                 return
-            
-            # Mark as in progress
-            task.mark_in_progress()
-            await self._task_repository.update_task(task)
-            self._logger.info(f"task_marked_in_progress | task_id=<{task_id}>")
+            self._logger.info("task_marked_in_progress | task_id=<%s>", task_id)
             
             # Get the agent repository from the use case (to access MCP tools)
             agent_repository = self._execute_task_use_case._agent_repository
@@ -65,33 +65,38 @@ class TaskApplicationService(TaskServicePort):
             # Check if agent is available
             if not agent_repository.is_available():
                 self._logger.error(f"agent_not_available | task_id=<{task_id}>")
-                task.mark_failed("AI agent is not available")
-                await self._task_repository.update_task(task)
+                await self._task_repository.fail_if_active(task_id, "AI agent is not available")
                 return
             
-            self._logger.info(f"agent_available | task_id=<{task_id}> | executing_prompt")
+            # An account switch may still be restarting the MCP servers
+            if self._aws_service:
+                await self._aws_service.wait_ready()
+            
+            self._logger.info("agent_available | task_id=<%s> | executing_prompt", task_id)
             
             # Execute the task directly with the agent repository
             result = await agent_repository.execute_prompt(description, None)
             
-            self._logger.info(f"task_execution_completed | task_id=<{task_id}> | result_length=<{len(str(result))}>")
+            # Only measure the result when the line is emitted; a non-str result
+            # would otherwise be rendered just to take its length
+            if self._logger.isEnabledFor(logging.INFO):
+                result_length = len(result) if isinstance(result, str) else len(str(result))
+                self._logger.info("task_execution_completed | task_id=<%s> | result_length=<%s>", task_id, result_length)
             
-            # Update task with result
-            task.mark_completed(result)
-            await self._task_repository.update_task(task)
+            # Store the result unless the task was cancelled while it ran
+            if not await self._task_repository.complete_if_in_progress(task_id, result):
+                self._logger.warning("task_result_discarded | task_id=<%s> | task no longer in progress", task_id)
+                return
             
-            self._logger.info(f"task_background_completed | task_id=<{task_id}>")
+            self._logger.info("task_background_completed | task_id=<%s>", task_id)
             
         except Exception as e:
             self._logger.error(f"task_background_error | task_id=<{task_id}> | error=<{str(e)}>")
             
             # Handle any errors in background execution
             try:
-                task = await self._task_repository.get_task_by_id(task_id)
-                if task:
-                    task.mark_failed(f"Background execution failed: {str(e)}")
-                    await self._task_repository.update_task(task)
-                    self._logger.info(f"task_marked_failed | task_id=<{task_id}>")
+                if await self._task_repository.fail_if_active(task_id, f"Background execution failed: {str(e)}"):
+                    self._logger.info("task_marked_failed | task_id=<%s>", task_id)
             except Exception as update_error:
                 self._logger.error(f"task_update_error | task_id=<{task_id}> | error=<{str(update_error)}>")
                 pass
@@ -100,15 +105,12 @@ class TaskApplicationService(TaskServicePort):
         """Get a task by ID"""
         return await self._task_repository.get_task_by_id(task_id)
 
-    async def get_tasks(self, limit: int = 100, offset: int = 0) -> List[Task]:
+    async def get_tasks(self, limit: int = 100, offset: int = 0,
+                        cursor: Optional[Tuple[datetime, str]] = None) -> List[Task]:
         """Get list of tasks"""
-        return await self._task_repository.get_tasks(limit=limit, offset=offset)
+        return await self._task_repository.get_tasks(limit=limit, offset=offset, cursor=cursor)
 
     async def cancel_task(self, task_id: str) -> bool:
         """Cancel a running task"""
-        task = await self._task_repository.get_task_by_id(task_id)
-        if task and task.status.value in ["pending", "in_progress"]:
-            task.mark_failed("Task cancelled by user")
-            await self._task_repository.update_task(task)
-            return True
-        return False 
\ No newline at end of file
+        task = await self._task_repository.fail_if_active(task_id, "Task cancelled by user")
+        return task is not None 
\ No newline at end of file
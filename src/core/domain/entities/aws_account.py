@@ -3,16 +3,17 @@ from datetime import datetime
 from typing import Optional
 from core.domain.value_objects.aws_credentials import AWSCredentials
 from core.domain.entities.aws_account_metadata import AWSAccountMetadata
-from infrastructure.credential_manager import get_credential_manager
 
 
-@dataclass
+@dataclass(slots=True)
 class AWSAccount:
     """
     Domain entity representing a registered AWS account.
     
     This is a composite entity that combines metadata (stored in DB) 
-    with credentials (stored in memory only).
+    with credentials (stored in memory only). The credential manager is
+    imported where it's used, so importing the entity doesn't load the
+    infrastructure layer (and its logging setup).
     """
     metadata: AWSAccountMetadata
     credentials: Optional[AWSCredentials] = None
@@ -72,31 +73,34 @@ class AWSAccount:
         )
         return cls(metadata=metadata, credentials=credentials)
     
-    async def update_credentials(self, credentials: AWSCredentials) -> None:
+    async def update_credentials(self, credentials: AWSCredentials, now: Optional[datetime] = None) -> None:
         """Update account credentials (stored in memory only)"""
         self.credentials = credentials
         self.metadata.region = credentials.region
         self.metadata.uses_profile = credentials.uses_profile()
-        self.metadata.updated_at = datetime.utcnow()
+        self.metadata.updated_at = now or datetime.utcnow()
     
-    def update_account_id(self, account_id: str) -> None:
+    def update_account_id(self, account_id: str, now: Optional[datetime] = None) -> None:
         """Update the AWS account ID after validation"""
-        self.metadata.update_account_id(account_id)
+        self.metadata.update_account_id(account_id, now)
     
-    def mark_as_default(self) -> None:
+    def mark_as_default(self, now: Optional[datetime] = None) -> None:
         """Mark this account as the default"""
-        self.metadata.mark_as_default()
+        self.metadata.mark_as_default(now)
     
-    def unmark_as_default(self) -> None:
+    def unmark_as_default(self, now: Optional[datetime] = None) -> None:
         """Remove default status from this account"""
-        self.metadata.unmark_as_default()
+        self.metadata.unmark_as_default(now)
     
     def to_dict(self) -> dict:
         """Convert to dictionary for API responses (excludes sensitive credentials)"""
         return self.metadata.to_dict()
     
-    async def load_credentials(self) -> bool:
-        """Load credentials from in-memory store"""
+    async def load_credentials(self, force: bool = False) -> bool:
+        """Load credentials from in-memory store, unless already attached (or force is set)"""
+        if self.credentials is not None and not force:
+            return True
+        from infrastructure.credential_manager import get_credential_manager
         credential_manager = get_credential_manager()
         self.credentials = await credential_manager.get_credentials(self.alias)
         return self.credentials is not None
@@ -104,11 +108,13 @@ class AWSAccount:
     async def store_credentials(self) -> None:
         """Store credentials in in-memory store"""
         if self.credentials:
+            from infrastructure.credential_manager import get_credential_manager
             credential_manager = get_credential_manager()
             await credential_manager.store_credentials(self.alias, self.credentials)
     
     async def remove_credentials(self) -> bool:
         """Remove credentials from in-memory store"""
+        from infrastructure.credential_manager import get_credential_manager
         credential_manager = get_credential_manager()
         removed = await credential_manager.remove_credentials(self.alias)
         if removed:
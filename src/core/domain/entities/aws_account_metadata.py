@@ -3,7 +3,7 @@ from datetime import datetime
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class AWSAccountMetadata:
     """Domain entity representing AWS account metadata (without credentials)"""
     alias: str
@@ -16,25 +16,27 @@ class AWSAccountMetadata:
     updated_at: Optional[datetime] = None
     
     def __post_init__(self):
-        if self.created_at is None:
-            self.created_at = datetime.utcnow()
-        if self.updated_at is None:
-            self.updated_at = datetime.utcnow()
+        if self.created_at is None or self.updated_at is None:
+            now = datetime.utcnow()
+            if self.created_at is None:
+                self.created_at = now
+            if self.updated_at is None:
+                self.updated_at = now
     
-    def update_account_id(self, account_id: str) -> None:
+    def update_account_id(self, account_id: str, now: Optional[datetime] = None) -> None:
         """Update the AWS account ID after validation"""
         self.account_id = account_id
-        self.updated_at = datetime.utcnow()
+        self.updated_at = now or datetime.utcnow()
     
-    def mark_as_default(self) -> None:
+    def mark_as_default(self, now: Optional[datetime] = None) -> None:
         """Mark this account as the default"""
         self.is_default = True
-        self.updated_at = datetime.utcnow()
+        self.updated_at = now or datetime.utcnow()
     
-    def unmark_as_default(self) -> None:
+    def unmark_as_default(self, now: Optional[datetime] = None) -> None:
         """Remove default status from this account"""
         self.is_default = False
-        self.updated_at = datetime.utcnow()
+        self.updated_at = now or datetime.utcnow()
     
     def to_dict(self) -> dict:
         """Convert to dictionary for API responses"""
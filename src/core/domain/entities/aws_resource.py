@@ -1,9 +1,9 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Dict, Any, Optional
 from enum import Enum
 
 
-class ResourceStatus(Enum):
+class ResourceStatus(str, Enum):
     RUNNING = "running"
     STOPPED = "stopped"
     PENDING = "pending"
@@ -11,7 +11,7 @@ class ResourceStatus(Enum):
     UNKNOWN = "unknown"
 
 
-class ResourceType(Enum):
+class ResourceType(str, Enum):
     EC2_INSTANCE = "ec2_instance"
     RDS_INSTANCE = "rds_instance"
     S3_BUCKET = "s3_bucket"
@@ -23,7 +23,7 @@ class ResourceType(Enum):
     CLOUDFORMATION_STACK = "cloudformation_stack"
 
 
-@dataclass
+@dataclass(slots=True)
 class AWSResource:
     """Domain entity representing an AWS resource"""
     id: str
@@ -31,17 +31,11 @@ class AWSResource:
     resource_type: ResourceType
     region: str
     status: ResourceStatus
-    tags: Dict[str, str] = None
-    properties: Dict[str, Any] = None
+    tags: Dict[str, str] = field(default_factory=dict)
+    properties: Dict[str, Any] = field(default_factory=dict)
     cost_estimate: Optional[float] = None
     security_score: Optional[int] = None
 
-    def __post_init__(self):
-        if self.tags is None:
-            self.tags = {}
-        if self.properties is None:
-            self.properties = {}
-
     def has_tag(self, key: str) -> bool:
         """Check if resource has a specific tag"""
         return key in self.tags
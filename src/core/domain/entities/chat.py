@@ -1,10 +1,14 @@
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Literal
+from typing import Literal, get_args
 
 MessageRole = Literal["user", "assistant"]
 
-@dataclass
+# Canonical role strings, so messages share one instance per role instead of
+# each holding its own copy decoded from a request or database row
+MESSAGE_ROLES = {role: role for role in get_args(MessageRole)}
+
+@dataclass(slots=True)
 class ChatMessage:
     """Domain entity representing a chat message"""
     id: str
@@ -24,7 +28,7 @@ class ChatMessage:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class Conversation:
     """Domain entity representing a conversation"""
     id: str
@@ -44,7 +48,7 @@ class Conversation:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class ChatProcessingResult:
     """Result of processing a chat message"""
     response: str
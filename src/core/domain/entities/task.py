@@ -4,14 +4,18 @@ from enum import Enum
 from typing import Optional, Dict, Any
 
 
-class TaskStatus(Enum):
+class TaskStatus(str, Enum):
     PENDING = "pending"
     IN_PROGRESS = "in_progress"
     COMPLETED = "completed"
     FAILED = "failed"
 
 
-@dataclass
+# Statuses a task can still be started or cancelled from
+ACTIVE_TASK_STATUSES = frozenset({TaskStatus.PENDING, TaskStatus.IN_PROGRESS})
+
+
+@dataclass(slots=True)
 class Task:
     """Domain entity representing a cloud engineering task"""
     id: str
@@ -0,0 +1,12 @@
+"""Identifier generation for domain entities"""
+
+import os
+
+
+def new_id() -> str:
+    """Random RFC 4122 version 4 UUID string, without building a uuid.UUID object"""
+    raw = bytearray(os.urandom(16))
+    raw[6] = raw[6] & 0x0F | 0x40  # version 4
+    raw[8] = raw[8] & 0x3F | 0x80  # RFC 4122 variant
+    h = raw.hex()
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
@@ -1,11 +1,16 @@
 import asyncio
+import time
+from collections import OrderedDict
 from typing import Optional, Dict
-from datetime import datetime, timedelta
+from datetime import datetime
 from dataclasses import dataclass
 from infrastructure.logging import get_logger
 
+# Failed validations are retried sooner than successful ones are refreshed
+INVALID_CONTEXT_TTL_SECONDS = 60
 
-@dataclass
+
+@dataclass(slots=True)
 class AccountContext:
     """Cached account context information"""
     alias: str
@@ -13,16 +18,21 @@ class AccountContext:
     last_validated: datetime
     account_id: Optional[str] = None
     region: Optional[str] = None
+    # time.monotonic() deadline; last_validated is kept for display
+    expires_at: float = 0.0
 
 
 class AccountContextCache:
     """High-performance cache for AWS account context to avoid redundant validations"""
     
-    def __init__(self, ttl_seconds: int = 300):  # 5 minutes default TTL
-        self._cache: Dict[str, AccountContext] = {}
-        self._ttl = timedelta(seconds=ttl_seconds)
+    def __init__(self, ttl_seconds: int = 300, max_entries: int = 1024):  # 5 minutes default TTL
+        # Least recently used first; a full cache evicts the entry closest to expiry
+        self._cache: OrderedDict[str, AccountContext] = OrderedDict()
+        self._ttl_seconds = ttl_seconds
+        self._max_entries = max_entries
+        self._evictions = 0
         self._logger = get_logger(__name__)
-        self._validation_locks: Dict[str, asyncio.Lock] = {}
+        self._validations_in_flight: Dict[str, asyncio.Task] = {}
     
     async def get_validated_context(
         self, 
@@ -37,55 +47,77 @@ class AccountContextCache:
             self._logger.debug(f"Using cached context for account '{account_alias}'")
             return cached
         
-        # Ensure only one validation per account happens at a time
-        if account_alias not in self._validation_locks:
-            self._validation_locks[account_alias] = asyncio.Lock()
+        # Concurrent callers for the same alias share one validation
+        task = self._validations_in_flight.get(account_alias)
+        if task is None:
+            task = asyncio.create_task(self._validate(account_alias, validator_func))
+            self._validations_in_flight[account_alias] = task
+            task.add_done_callback(lambda done: self._validation_finished(account_alias, done))
         
-        async with self._validation_locks[account_alias]:
-            # Double-check cache after acquiring lock (another request might have validated)
-            cached = self._get_cached_context(account_alias)
-            if cached and self._is_cache_valid(cached):
-                return cached
+        # A cancelled caller must not cancel the validation other callers are sharing
+        return await asyncio.shield(task)
+    
+    async def _validate(self, account_alias: str, validator_func) -> AccountContext:
+        """Run the validator and cache the resulting context"""
+        try:
+            self._logger.debug(f"Validating account context for '{account_alias}'")
+            account_info = await validator_func(account_alias)
+            
+            context = AccountContext(
+                alias=account_alias,
+                is_valid=True,
+                last_validated=datetime.now(),
+                account_id=getattr(account_info, 'account_id', None),
+                region=getattr(account_info, 'region', None),
+                expires_at=time.monotonic() + self._ttl_seconds
+            )
             
-            # Validate and cache the context
-            try:
-                self._logger.debug(f"Validating account context for '{account_alias}'")
-                account_info = await validator_func(account_alias)
-                
-                context = AccountContext(
-                    alias=account_alias,
-                    is_valid=True,
-                    last_validated=datetime.now(),
-                    account_id=getattr(account_info, 'account_id', None),
-                    region=getattr(account_info, 'region', None)
-                )
-                
-                self._cache[account_alias] = context
-                self._logger.debug(f"Cached valid context for account '{account_alias}'")
-                return context
-                
-            except Exception as e:
-                # Cache failed validation to avoid immediate retry
-                context = AccountContext(
-                    alias=account_alias,
-                    is_valid=False,
-                    last_validated=datetime.now()
-                )
-                # Cache failed validation for shorter time (1 minute)
-                self._cache[account_alias] = context
-                self._logger.warning(f"Cached invalid context for account '{account_alias}': {e}")
-                raise
+            self._store_context(context)
+            self._logger.debug(f"Cached valid context for account '{account_alias}'")
+            return context
+        
+        except Exception as e:
+            # Cache failed validation to avoid immediate retry
+            context = AccountContext(
+                alias=account_alias,
+                is_valid=False,
+                last_validated=datetime.now(),
+                expires_at=time.monotonic() + INVALID_CONTEXT_TTL_SECONDS
+            )
+            # Cache failed validation for shorter time (1 minute)
+            self._store_context(context)
+            self._logger.warning(f"Cached invalid context for account '{account_alias}': {e}")
+            raise
+    
+    def _validation_finished(self, account_alias: str, task: asyncio.Task) -> None:
+        """Forget a finished validation"""
+        if self._validations_in_flight.get(account_alias) is task:
+            del self._validations_in_flight[account_alias]
+        # Mark the error as retrieved in case every waiter was cancelled
+        if not task.cancelled():
+            task.exception()
     
     def _get_cached_context(self, account_alias: str) -> Optional[AccountContext]:
         """Get cached context if it exists"""
-        return self._cache.get(account_alias)
+        context = self._cache.get(account_alias)
+        if context is not None:
+            self._cache.move_to_end(account_alias)
+        return context
+    
+    def _store_context(self, context: AccountContext) -> None:
+        """Cache a context, evicting the entry closest to expiry when full"""
+        if context.alias not in self._cache and len(self._cache) >= self._max_entries:
+            # min() keeps the first of equal deadlines, i.e. the least recently used
+            victim = min(self._cache.values(), key=lambda ctx: ctx.expires_at)
+            del self._cache[victim.alias]
+            self._evictions += 1
+        self._cache[context.alias] = context
+        self._cache.move_to_end(context.alias)
     
     def _is_cache_valid(self, context: AccountContext) -> bool:
         """Check if cached context is still valid"""
-        age = datetime.now() - context.last_validated
-        # Use shorter TTL for failed validations
-        ttl = timedelta(seconds=60) if not context.is_valid else self._ttl
-        return age < ttl
+        # The deadline already reflects the shorter TTL for failed validations
+        return time.monotonic() < context.expires_at
     
     def invalidate_account(self, account_alias: str) -> None:
         """Invalidate cached context for an account"""
@@ -100,12 +132,15 @@ class AccountContextCache:
     
     def get_cache_stats(self) -> Dict[str, int]:
         """Get cache statistics for monitoring"""
-        valid_entries = sum(1 for ctx in self._cache.values() if ctx.is_valid and self._is_cache_valid(ctx))
+        # One clock read for the whole scan; the cache is bounded by max_entries
+        now = time.monotonic()
+        valid_entries = sum(1 for ctx in self._cache.values() if ctx.is_valid and ctx.expires_at > now)
         invalid_entries = len(self._cache) - valid_entries
         
         return {
             "total_entries": len(self._cache),
             "valid_entries": valid_entries,
             "invalid_entries": invalid_entries,
-            "locks_active": len(self._validation_locks)
+            "validations_in_flight": len(self._validations_in_flight),
+            "evictions": self._evictions
         } 
\ No newline at end of file
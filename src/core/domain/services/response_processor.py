@@ -3,6 +3,9 @@ import ast
 from typing import Optional
 from infrastructure.logging import get_logger
 
+_THINKING_BLOCK_RE = re.compile(r'<thinking>.*?</thinking>', re.DOTALL)
+_STRUCTURED_TEXT_RE = re.compile(r"'text': '(.+?)(?:'}]|})", re.DOTALL)
+
 
 class AgentResponseProcessor:
     """Domain service for processing and cleaning agent responses"""
@@ -37,13 +40,17 @@ class AgentResponseProcessor:
     
     def _remove_thinking_blocks(self, response: str) -> str:
         """Remove <thinking>...</thinking> blocks from response."""
-        return re.sub(r'<thinking>.*?</thinking>', '', response, flags=re.DOTALL)
+        # Most responses have no thinking block; skip the regex scan for them
+        if '<thinking>' not in response:
+            return response
+        return _THINKING_BLOCK_RE.sub('', response)
     
     def _extract_structured_content(self, response: str) -> Optional[str]:
         """Extract content from structured response format."""
         
-        # Check if response is in structured format
-        if not ("'role': 'assistant'" in response and "'content'" in response and "'text'" in response):
+        # Check if response is in structured format; plain answers rarely
+        # contain the quoted 'text' key, so that check usually decides alone
+        if not ("'text'" in response and "'role': 'assistant'" in response and "'content'" in response):
             return None
         
         try:
@@ -64,14 +71,16 @@ class AgentResponseProcessor:
     def _extract_with_regex(self, response: str) -> Optional[str]:
         """Extract text content using regex as fallback."""
         
-        match = re.search(r"'text': '(.+?)(?:'}]|})", response, re.DOTALL)
+        match = _STRUCTURED_TEXT_RE.search(response)
         if match:
             text = match.group(1)
-            # Unescape the content
-            text = text.replace('\\n', '\n')
-            text = text.replace('\\t', '\t')
-            text = text.replace("\\'", "'")
-            text = text.replace('\\"', '"')
+            # Unescape the content; every escape starts with a backslash, so
+            # text without one is returned without four more full scans
+            if '\\' in text:
+                text = text.replace('\\n', '\n')
+                text = text.replace('\\t', '\t')
+                text = text.replace("\\'", "'")
+                text = text.replace('\\"', '"')
             return text
         
         return None 
\ No newline at end of file
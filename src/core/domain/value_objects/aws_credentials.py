@@ -1,5 +1,33 @@
+import hashlib
 from dataclasses import dataclass
-from typing import Optional
+from typing import Optional, Tuple
+
+
+def _build_environment(
+    access_key_id: Optional[str],
+    secret_access_key: Optional[str],
+    session_token: Optional[str],
+    region: str,
+    profile: Optional[str]
+) -> Tuple[Tuple[str, Optional[str]], ...]:
+    """Build the AWS_* environment for one set of credentials (None means unset)"""
+    if access_key_id is not None and secret_access_key is not None:
+        return (
+            ("AWS_ACCESS_KEY_ID", access_key_id or ""),
+            ("AWS_SECRET_ACCESS_KEY", secret_access_key or ""),
+            ("AWS_SESSION_TOKEN", session_token or None),
+            ("AWS_PROFILE", None),
+            ("AWS_DEFAULT_REGION", region),
+        )
+    if profile is not None:
+        return (
+            ("AWS_PROFILE", profile or ""),
+            ("AWS_ACCESS_KEY_ID", None),
+            ("AWS_SECRET_ACCESS_KEY", None),
+            ("AWS_SESSION_TOKEN", None),
+            ("AWS_DEFAULT_REGION", region),
+        )
+    return (("AWS_DEFAULT_REGION", region),)
 
 
 @dataclass(frozen=True)
@@ -27,6 +55,29 @@ class AWSCredentials:
         """Check if using access keys"""
         return self.access_key_id is not None and self.secret_access_key is not None
 
+    def environment_variables(self) -> Tuple[Tuple[str, Optional[str]], ...]:
+        """AWS_* environment variable pairs for these credentials"""
+        return _build_environment(
+            self.access_key_id,
+            self.secret_access_key,
+            self.session_token,
+            self.region,
+            self.profile
+        )
+
+    def fingerprint(self) -> str:
+        """Stable cache key for these credentials that doesn't keep the secrets themselves"""
+        material = "|".join(
+            value or "" for value in (
+                self.access_key_id,
+                self.secret_access_key,
+                self.session_token,
+                self.profile,
+                self.region,
+            )
+        )
+        return hashlib.sha256(material.encode()).hexdigest()
+
 
 @dataclass(frozen=True)
 class AWSAccountInfo:
@@ -7,6 +7,9 @@ from core.domain.value_objects.aws_credentials import AWSAccountInfo
 class AWSServicePort(ABC):
     """Inbound port for AWS operations"""
 
+    # Lets implementations declare __slots__ without gaining an instance __dict__ here
+    __slots__ = ()
+
     @abstractmethod
     async def set_active_account(self, account_alias: str) -> None:
         """Set active AWS account for current session"""
@@ -17,6 +20,11 @@ class AWSServicePort(ABC):
         """Clear active AWS account"""
         pass
 
+    @abstractmethod
+    async def wait_ready(self) -> None:
+        """Wait until tools run with the credentials of the current active account"""
+        pass
+
     @abstractmethod
     def get_active_account_alias(self) -> Optional[str]:
         """Get current active account alias"""
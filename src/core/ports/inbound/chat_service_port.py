@@ -1,10 +1,14 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from datetime import datetime
+from typing import List, Optional, Tuple
 from src.core.domain.entities.chat import ChatMessage, Conversation
 
 class ChatServicePort(ABC):
     """Port for chat service operations."""
     
+    # Lets implementations declare __slots__ without gaining an instance __dict__ here
+    __slots__ = ()
+    
     @abstractmethod
     async def create_conversation(self, title: str, account_alias: Optional[str] = None) -> Conversation:
         """Create a new conversation with auto-generated ID."""
@@ -16,7 +20,8 @@ class ChatServicePort(ABC):
         pass
     
     @abstractmethod
-    async def list_conversations(self, limit: int = 50, offset: int = 0) -> List[Conversation]:
+    async def list_conversations(self, limit: int = 50, offset: int = 0,
+                                 cursor: Optional[Tuple[datetime, str]] = None) -> List[Conversation]:
         """List conversations with pagination."""
         pass
     
@@ -36,7 +41,8 @@ class ChatServicePort(ABC):
         pass
     
     @abstractmethod
-    async def get_conversation_messages(self, conversation_id: str, limit: int = 100, offset: int = 0) -> List[ChatMessage]:
+    async def get_conversation_messages(self, conversation_id: str, limit: int = 100, offset: int = 0,
+                                        cursor: Optional[Tuple[datetime, str]] = None) -> List[ChatMessage]:
         """Get messages for a conversation with pagination."""
         pass
     
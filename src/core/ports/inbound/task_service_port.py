@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from datetime import datetime
+from typing import List, Optional, Tuple
 from core.domain.entities.task import Task
 
 
@@ -22,7 +23,8 @@ class TaskServicePort(ABC):
         pass
 
     @abstractmethod
-    async def get_tasks(self, limit: int = 100, offset: int = 0) -> List[Task]:
+    async def get_tasks(self, limit: int = 100, offset: int = 0,
+                        cursor: Optional[Tuple[datetime, str]] = None) -> List[Task]:
         """Get list of tasks"""
         pass
 
@@ -7,8 +7,8 @@ class AWSAccountRepositoryPort(ABC):
     """Outbound port for AWS account repository operations"""
 
     @abstractmethod
-    async def save_account(self, account: AWSAccount) -> AWSAccount:
-        """Save an AWS account"""
+    async def save_account(self, account: AWSAccount, make_default: bool = False) -> AWSAccount:
+        """Save an AWS account, optionally making it the only default in the same write"""
         pass
 
     @abstractmethod
@@ -22,8 +22,8 @@ class AWSAccountRepositoryPort(ABC):
         pass
 
     @abstractmethod
-    async def delete_account(self, alias: str) -> bool:
-        """Delete an AWS account by alias"""
+    async def delete_account(self, alias: str, new_default_alias: Optional[str] = None) -> bool:
+        """Delete an AWS account by alias, optionally making another account the default in the same transaction"""
         pass
 
     @abstractmethod
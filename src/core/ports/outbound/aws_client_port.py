@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from core.domain.value_objects.aws_credentials import AWSCredentials, AWSAccountInfo
 
 
@@ -16,6 +16,11 @@ class AWSClientPort(ABC):
         """Get AWS caller identity information"""
         pass
 
+    @abstractmethod
+    async def validate_and_describe(self, credentials: AWSCredentials) -> Optional[AWSAccountInfo]:
+        """Validate credentials and return their caller identity, or None if they are rejected"""
+        pass
+
     @abstractmethod
     async def list_ec2_instances(self, credentials: AWSCredentials, region: str = None) -> List[Dict[str, Any]]:
         """List EC2 instances"""
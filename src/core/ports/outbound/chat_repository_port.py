@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from datetime import datetime
+from typing import List, Optional, Tuple
 from src.core.domain.entities.chat import ChatMessage, Conversation
 
 class ChatRepositoryPort(ABC):
@@ -16,8 +17,19 @@ class ChatRepositoryPort(ABC):
         pass
     
     @abstractmethod
-    async def list_conversations(self, limit: int = 50, offset: int = 0) -> List[Conversation]:
-        """List conversations with pagination."""
+    async def list_conversations(self, limit: int = 50, offset: int = 0,
+                                 cursor: Optional[Tuple[datetime, str]] = None) -> List[Conversation]:
+        """
+        List conversations with pagination, most recently updated first.
+        
+        When cursor is given as the (updated_at, id) of the last conversation of
+        the previous page, the page after it is returned and offset is ignored.
+        """
+        pass
+    
+    @abstractmethod
+    async def get_most_recent_conversation(self) -> Optional[Conversation]:
+        """Get the most recently updated conversation, if any."""
         pass
     
     @abstractmethod
@@ -25,6 +37,11 @@ class ChatRepositoryPort(ABC):
         """Update conversation."""
         pass
     
+    @abstractmethod
+    async def update_conversation_title(self, conversation_id: str, title: str, updated_at: datetime) -> Optional[Conversation]:
+        """Set a conversation's title, returning the updated conversation or None if it doesn't exist."""
+        pass
+    
     @abstractmethod
     async def delete_conversation(self, conversation_id: str) -> bool:
         """Delete conversation and all its messages."""
@@ -32,12 +49,22 @@ class ChatRepositoryPort(ABC):
     
     @abstractmethod
     async def add_message(self, message: ChatMessage) -> ChatMessage:
-        """Add message to conversation."""
+        """Add message to conversation.
+        
+        Raises:
+            ConversationNotFoundError: If the conversation doesn't exist
+        """
         pass
     
     @abstractmethod
-    async def get_messages(self, conversation_id: str, limit: int = 100, offset: int = 0) -> List[ChatMessage]:
-        """Get messages for a conversation with pagination."""
+    async def get_messages(self, conversation_id: str, limit: int = 100, offset: int = 0,
+                           cursor: Optional[Tuple[datetime, str]] = None) -> List[ChatMessage]:
+        """
+        Get messages for a conversation with pagination, oldest first.
+        
+        When cursor is given as the (timestamp, id) of the last message of the
+        previous page, the page after it is returned and offset is ignored.
+        """
         pass
     
     @abstractmethod
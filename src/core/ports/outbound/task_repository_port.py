@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from datetime import datetime
+from typing import List, Optional, Tuple
 from core.domain.entities.task import Task
 
 
@@ -17,8 +18,14 @@ class TaskRepositoryPort(ABC):
         pass
 
     @abstractmethod
-    async def get_tasks(self, limit: int = 100, offset: int = 0) -> List[Task]:
-        """Get list of tasks with pagination"""
+    async def get_tasks(self, limit: int = 100, offset: int = 0,
+                        cursor: Optional[Tuple[datetime, str]] = None) -> List[Task]:
+        """
+        Get list of tasks with pagination, newest first
+
+        When cursor is given as the (created_at, id) of the last task of the
+        previous page, the page after it is returned and offset is ignored.
+        """
         pass
 
     @abstractmethod
@@ -26,6 +33,36 @@ class TaskRepositoryPort(ABC):
         """Update an existing task"""
         pass
 
+    @abstractmethod
+    async def mark_in_progress_if_pending(self, task_id: str) -> Optional[Task]:
+        """
+        Move a pending task to in progress in a single step
+
+        Returns the updated task, or None if the task doesn't exist or is no
+        longer pending (e.g. it was cancelled before it started).
+        """
+        pass
+
+    @abstractmethod
+    async def complete_if_in_progress(self, task_id: str, result: str) -> Optional[Task]:
+        """
+        Mark an in-progress task as completed with its result in a single step
+
+        Returns the updated task, or None if the task doesn't exist or is no
+        longer in progress (e.g. it was cancelled while running).
+        """
+        pass
+
+    @abstractmethod
+    async def fail_if_active(self, task_id: str, error_message: str) -> Optional[Task]:
+        """
+        Mark a pending or in-progress task as failed in a single step
+
+        Used for cancellation as well as execution errors. Returns the updated
+        task, or None if the task doesn't exist or has already finished.
+        """
+        pass
+
     @abstractmethod
     async def delete_task(self, task_id: str) -> bool:
         """Delete a task"""
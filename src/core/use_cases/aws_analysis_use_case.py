@@ -23,10 +23,11 @@ class AWSAnalysisUseCase:
 
     async def get_account_info(self, credentials: AWSCredentials) -> AWSAccountInfo:
         """Get AWS account information"""
-        if not await self._aws_client.validate_credentials(credentials):
+        # GetCallerIdentity is itself the validation, so one STS call covers both
+        account_info = await self._aws_client.validate_and_describe(credentials)
+        if account_info is None:
             raise ValueError("Invalid AWS credentials")
-        
-        return await self._aws_client.get_caller_identity(credentials)
+        return account_info
 
     async def analyze_resources(self, credentials: AWSCredentials, resource_type: ResourceType = None) -> Dict[str, Any]:
         """Analyze AWS resources and provide insights"""
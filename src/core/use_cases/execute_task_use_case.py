@@ -1,6 +1,7 @@
-import uuid
 from typing import Dict, Any, Optional
 from core.domain.entities.task import Task, TaskStatus
+from core.domain.identifiers import new_id
+from core.ports.inbound.aws_service_port import AWSServicePort
 from core.ports.outbound.agent_repository_port import AgentRepositoryPort
 from core.ports.outbound.task_repository_port import TaskRepositoryPort
 
@@ -11,16 +12,18 @@ class ExecuteTaskUseCase:
     def __init__(
         self,
         agent_repository: AgentRepositoryPort,
-        task_repository: TaskRepositoryPort
+        task_repository: TaskRepositoryPort,
+        aws_service: Optional[AWSServicePort] = None
     ):
         self._agent_repository = agent_repository
         self._task_repository = task_repository
+        self._aws_service = aws_service
 
     async def execute(self, description: str, context: Optional[Dict[str, Any]] = None) -> Task:
         """Execute a cloud engineering task"""
         
         task = Task(
-            id=str(uuid.uuid4()),
+            id=new_id(),
             description=description,
             status=TaskStatus.PENDING
         )
@@ -36,6 +39,10 @@ class ExecuteTaskUseCase:
 
             prompt = self._prepare_prompt(description, context)
             
+            # An account switch may still be restarting the MCP servers
+            if self._aws_service:
+                await self._aws_service.wait_ready()
+            
             result = await self._agent_repository.execute_prompt(prompt, context)
             
             task.mark_completed(result)
@@ -3,9 +3,9 @@ import time
 from collections import OrderedDict
 from typing import Optional, Any
 from datetime import datetime
-import uuid
 
 from core.domain.entities.chat import ChatProcessingResult, ChatMessage
+from core.domain.identifiers import new_id
 from core.domain.services.response_processor import AgentResponseProcessor
 from core.domain.services.account_context_cache import AccountContextCache
 from core.domain.exceptions import (
@@ -18,6 +18,7 @@ from core.ports.outbound.chat_repository_port import ChatRepositoryPort
 from core.ports.outbound.agent_repository_port import AgentRepositoryPort
 from core.ports.outbound.aws_client_port import AWSClientPort
 from core.ports.inbound.chat_service_port import ChatServicePort
+from core.ports.inbound.aws_service_port import AWSServicePort
 from infrastructure.logging import get_logger
 
 
@@ -32,13 +33,15 @@ class ProcessChatMessageUseCase:
         aws_client: AWSClientPort,
         chat_service: ChatServicePort,
         max_cache_size: int = 100,
-        agent_timeout: float = 120.0
+        agent_timeout: float = 120.0,
+        aws_service: Optional[AWSServicePort] = None
     ):
         self._aws_account_repository = aws_account_repository
         self._chat_repository = chat_repository
         self._agent_repository = agent_repository
         self._aws_client = aws_client
         self._chat_service = chat_service
+        self._aws_service = aws_service
         self._logger = get_logger(__name__)
         self._response_processor = AgentResponseProcessor()
         
@@ -234,7 +237,7 @@ class ProcessChatMessageUseCase:
     async def _persist_user_message(self, conversation_id: str, message: str) -> str:
         """Persist user message with optimized database call"""
         user_message = ChatMessage(
-            id=str(uuid.uuid4()),
+            id=new_id(),
             conversation_id=conversation_id,
             role="user",
             content=message,
@@ -246,6 +249,11 @@ class ProcessChatMessageUseCase:
     
     async def _execute_agent_processing(self, message: str, conversation_id: str) -> str:
         """Execute agent processing with performance monitoring"""
+        # An account switch may still be restarting the MCP servers; this
+        # wait isn't counted against the agent timeout
+        if self._aws_service:
+            await self._aws_service.wait_ready()
+        
         start_time = time.monotonic()
         
         try:
@@ -312,7 +320,7 @@ class ProcessChatMessageUseCase:
         """Process agent response with optimized response handling"""
         
         # Generate unique message ID
-        message_id = str(uuid.uuid4())
+        message_id = new_id()
         
         # Clean response using the domain service
         cleaned_response = self._response_processor.clean_response(agent_response)
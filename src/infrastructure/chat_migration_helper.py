@@ -1,11 +1,13 @@
 import aiosqlite
 from infrastructure.logging import get_logger
+from infrastructure.sqlite_timestamps import convert_text_timestamps
 
 logger = get_logger(__name__)
 
 async def migrate_chat_database_if_needed(db_path: str) -> bool:
     """
-    Migrate chat database from account_alias to account_id.
+    Migrate chat database from account_alias to account_id, and from
+    ISO-8601 TEXT timestamps to INTEGER epoch microseconds.
     
     Returns True if migration was successful or not needed, False if failed.
     """
@@ -56,9 +58,27 @@ async def migrate_chat_database_if_needed(db_path: str) -> bool:
                 logger.info("Chat database already migrated to account_id")
             else:
                 logger.info("Chat database is new, no migration needed")
+            
+            if columns:
+                await _migrate_timestamps(db)
                 
         return True
         
     except Exception as e:
         logger.error(f"Chat database migration failed: {e}")
-        return False 
\ No newline at end of file
+        return False
+
+
+async def _migrate_timestamps(db: aiosqlite.Connection) -> None:
+    """Convert legacy TEXT timestamps to INTEGER epoch microseconds"""
+    converted = await convert_text_timestamps(db, "conversations", "id", ("created_at", "updated_at"))
+    
+    cursor = await db.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='chat_messages'")
+    has_messages = await cursor.fetchone() is not None
+    await cursor.close()
+    if has_messages:
+        converted += await convert_text_timestamps(db, "chat_messages", "id", ("timestamp",))
+    
+    if converted:
+        await db.commit()
+        logger.info(f"Converted {converted} chat timestamps to epoch microseconds")
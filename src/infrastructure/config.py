@@ -255,6 +255,7 @@ class DatabaseConfig:
     """Configuration for database operations"""
     type: str = "sqlite"  # "sqlite" or "memory"
     sqlite_path: str = "data/tasks.db"
+    read_cache_size: int = 256  # 0 disables; use when several processes share the database
     
     def validate(self) -> None:
         """Validate database configuration"""
@@ -262,6 +263,10 @@ class DatabaseConfig:
             raise ValueError(
                 f"DATABASE_TYPE must be either 'sqlite' or 'memory', got: {self.type}"
             )
+        if self.read_cache_size < 0:
+            raise ValueError(
+                f"DATABASE_READ_CACHE_SIZE must be zero or positive, got: {self.read_cache_size}"
+            )
 
 
 @dataclass(frozen=True)
@@ -407,7 +412,8 @@ class Config:
         # Database configuration
         database = DatabaseConfig(
             type=os.getenv("DATABASE_TYPE", "sqlite").lower(),
-            sqlite_path=os.getenv("DATABASE_SQLITE_PATH", "data/tasks.db")
+            sqlite_path=os.getenv("DATABASE_SQLITE_PATH", "data/tasks.db"),
+            read_cache_size=int(os.getenv("DATABASE_READ_CACHE_SIZE", "256"))
         )
         
         # MCP configuration
@@ -132,7 +132,8 @@ class DependencyContainer:
             config = get_config()
             if config.database.type == "sqlite":
                 self._instances['task_repository'] = SQLiteTaskRepositoryAdapter(
-                    db_path=config.database.sqlite_path
+                    db_path=config.database.sqlite_path,
+                    cache_size=config.database.read_cache_size
                 )
             else:
                 # Default to in-memory for backwards compatibility
@@ -163,7 +164,8 @@ class DependencyContainer:
                 loop.close()
             
             self._instances['chat_repository'] = SQLiteChatRepositoryAdapter(
-                db_path=chat_db_path
+                db_path=chat_db_path,
+                cache_size=config.database.read_cache_size
             )
         return self._instances['chat_repository']
 
@@ -184,7 +186,8 @@ class DependencyContainer:
         if 'execute_task_use_case' not in self._instances:
             self._instances['execute_task_use_case'] = ExecuteTaskUseCase(
                 agent_repository=self.get_agent_repository_adapter(),
-                task_repository=self.get_task_repository_adapter()
+                task_repository=self.get_task_repository_adapter(),
+                aws_service=self.get_aws_service()
             )
         return self._instances['execute_task_use_case']
 
@@ -208,7 +211,8 @@ class DependencyContainer:
                 agent_repository=self.get_agent_repository_adapter(),
                 aws_client=self.get_aws_client_adapter(),
                 chat_service=self.get_chat_service(),
-                agent_timeout=config.model.agent_timeout
+                agent_timeout=config.model.agent_timeout,
+                aws_service=self.get_aws_service()
             )
         return self._instances['process_chat_message_use_case']
 
@@ -217,7 +221,8 @@ class DependencyContainer:
         if 'task_service' not in self._instances:
             self._instances['task_service'] = TaskApplicationService(
                 execute_task_use_case=self.get_execute_task_use_case(),
-                task_repository=self.get_task_repository_adapter()
+                task_repository=self.get_task_repository_adapter(),
+                aws_service=self.get_aws_service()
             )
         return self._instances['task_service']
 
@@ -228,7 +233,8 @@ class DependencyContainer:
                 aws_analysis_use_case=self.get_aws_analysis_use_case(),
                 account_repository=self.get_aws_account_repository_adapter(),
                 mcp_reinitialization_port=self.get_mcp_reinitialization_adapter(),
-                default_credentials=default_credentials
+                default_credentials=default_credentials,
+                aws_account_service=self.get_aws_account_service()
             )
         return self._instances['aws_service']
 
@@ -8,7 +8,10 @@ Based on Strands Agents SDK logging patterns for consistency.
 """
 
 import sys
+import atexit
+import queue
 import logging
+import logging.handlers
 import structlog
 from typing import Any, Dict, Optional, List
 from enum import Enum
@@ -56,6 +59,30 @@ class StrandsStyleFormatter(logging.Formatter):
         return " | ".join(parts)
 
 
+class _InProcessQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler that hands records to the listener thread unformatted"""
+    
+    def prepare(self, record):
+        # The queue never leaves this process, so the record doesn't need to be
+        # made picklable; formatting stays on the listener thread
+        return record
+
+
+# Listener thread that owns the real handlers while logging is configured
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def _stop_queue_listener() -> None:
+    """Flush queued records and stop the listener thread"""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
+
+atexit.register(_stop_queue_listener)
+
+
 def configure_logging(
     level: str = "INFO",
     json_format: bool = False,
@@ -70,7 +97,13 @@ def configure_logging(
         json_format: Whether to output logs in JSON format
         log_file: Optional log file path
         service_name: Service name to include in all logs
+    
+    Records are written by a background listener thread, so console and file
+    I/O never blocks the event loop; the root logger only enqueues them.
     """
+    # Drain and stop the listener from any previous configuration
+    _stop_queue_listener()
+    
     # Set up root logger
     root_logger = logging.getLogger()
     root_logger.setLevel(getattr(logging, level.upper()))
@@ -88,10 +121,14 @@ def configure_logging(
         # For JSON format, use standard formatter
         console_handler.setFormatter(logging.Formatter('%(message)s'))
     
-    root_logger.addHandler(console_handler)
+    handlers: List[logging.Handler] = [console_handler]
     
     # Configure structlog processors
     processors: List[Any] = [
+        # Drop records below the stdlib level before any other processing, and
+        # interpolate %-style arguments only for records that are emitted
+        structlog.stdlib.filter_by_level,
+        structlog.stdlib.PositionalArgumentsFormatter(),
         structlog.contextvars.merge_contextvars,
         structlog.processors.add_log_level,
         structlog.processors.StackInfoRenderer(),
@@ -126,7 +163,14 @@ def configure_logging(
         
         # Always use JSON format for file logs
         file_handler.setFormatter(logging.Formatter('%(message)s'))
-        root_logger.addHandler(file_handler)
+        handlers.append(file_handler)
+    
+    # Route records through an unbounded queue to the listener thread
+    global _queue_listener
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    root_logger.addHandler(_InProcessQueueHandler(log_queue))
+    _queue_listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _queue_listener.start()
         
     # Set specific log levels for our modules to match Strands patterns
     # Agent lifecycle logs
@@ -0,0 +1,52 @@
+"""
+Timestamp encoding for SQLite persistence.
+
+Datetimes are stored as INTEGER microseconds since 1970-01-01 of their
+wall-clock value. Naive datetimes round-trip unchanged (no local timezone
+is applied), integer ordering matches chronological ordering, and reads
+avoid parsing ISO-8601 strings for every row.
+"""
+
+from datetime import datetime, timedelta, timezone
+from typing import Iterable
+
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def to_epoch_micros(value: datetime) -> int:
+    """Encode a datetime as integer microseconds (aware values are normalized to UTC)"""
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return (value - _EPOCH) // _MICROSECOND
+
+
+def from_epoch_micros(value: int) -> datetime:
+    """Decode integer microseconds back into a naive datetime"""
+    return _EPOCH + timedelta(microseconds=value)
+
+
+async def convert_text_timestamps(db, table: str, key_column: str, columns: Iterable[str]) -> int:
+    """
+    Rewrite legacy ISO-8601 TEXT timestamps in place as epoch microseconds.
+
+    Only suitable for columns without TEXT affinity (e.g. declared TIMESTAMP
+    or INTEGER); TEXT columns would coerce the integers back into strings.
+
+    Returns the number of values converted.
+    """
+    converted = 0
+    for column in columns:
+        cursor = await db.execute(
+            f"SELECT {key_column}, {column} FROM {table} WHERE typeof({column}) = 'text'"
+        )
+        rows = await cursor.fetchall()
+        await cursor.close()
+
+        if rows:
+            await db.executemany(
+                f"UPDATE {table} SET {column} = ? WHERE {key_column} = ?",
+                [(to_epoch_micros(datetime.fromisoformat(value)), key) for key, value in rows]
+            )
+            converted += len(rows)
+    return converted
@@ -0,0 +1,76 @@
+import aiosqlite
+from datetime import datetime
+from infrastructure.logging import get_logger
+from infrastructure.sqlite_timestamps import to_epoch_micros
+
+logger = get_logger(__name__)
+
+
+def _convert_timestamp(value):
+    """Convert a legacy ISO-8601 timestamp to epoch microseconds"""
+    if isinstance(value, str):
+        return to_epoch_micros(datetime.fromisoformat(value))
+    return value
+
+
+async def migrate_task_database_if_needed(db_path) -> bool:
+    """
+    Migrate task database from ISO-8601 TEXT timestamps to INTEGER epoch microseconds.
+
+    The legacy columns have TEXT affinity, so the table is rebuilt rather
+    than updated in place.
+
+    Returns True if migration was successful or not needed, False if failed.
+    """
+    try:
+        async with aiosqlite.connect(db_path) as db:
+            cursor = await db.execute("PRAGMA table_info(tasks)")
+            columns = {col[1]: col[2].upper() for col in await cursor.fetchall()}
+            await cursor.close()
+
+            if columns.get("created_at") != "TEXT":
+                return True
+
+            logger.info("Migrating task database timestamps to epoch microseconds")
+
+            await db.execute("BEGIN")
+            await db.execute("ALTER TABLE tasks RENAME TO tasks_legacy")
+            await db.execute("""
+                CREATE TABLE tasks (
+                    id TEXT PRIMARY KEY,
+                    description TEXT NOT NULL,
+                    account_alias TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    created_at INTEGER NOT NULL,
+                    completed_at INTEGER,
+                    result TEXT,
+                    error_message TEXT,
+                    metadata TEXT
+                )
+            """)
+
+            cursor = await db.execute("""
+                SELECT id, description, account_alias, status, created_at, completed_at, result, error_message, metadata
+                FROM tasks_legacy
+            """)
+            rows = await cursor.fetchall()
+            await cursor.close()
+
+            await db.executemany("""
+                INSERT INTO tasks
+                (id, description, account_alias, status, created_at, completed_at, result, error_message, metadata)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, [
+                (*row[:4], _convert_timestamp(row[4]), _convert_timestamp(row[5]), *row[6:])
+                for row in rows
+            ])
+
+            await db.execute("DROP TABLE tasks_legacy")
+            await db.commit()
+            logger.info(f"Task database migration completed successfully ({len(rows)} tasks)")
+
+        return True
+
+    except Exception as e:
+        logger.error(f"Task database migration failed: {e}")
+        return False